@@ -8,16 +8,37 @@ Buffer years (±1) are included because when converting to local time,
 data from adjacent years may be needed to ensure complete coverage at
 year boundaries.
 
+Downloads run concurrently over a single pooled client. While they run, a
+one-line progress counter is redrawn on stderr (when it is a terminal), and the
+per-file status lines are printed once all downloads have finished. Files are written to a
+`.part` file first and renamed on completion, so interrupted downloads never
+leave a truncated `.gz` behind and are resumed on the next run.
+
 Usage:
     python scripts/download_sample_data.py
 """
 
+import asyncio
+import importlib.util
+import os
+import sys
+from collections.abc import Iterable
 from pathlib import Path
 
 import httpx
 
 BASE_URL = "https://www.ncei.noaa.gov/pub/data/noaa"
 
+# Maximum number of simultaneous connections to the NCEI server
+MAX_CONNECTIONS = 16
+
+# HTTP/2 multiplexes all downloads over one connection, but needs the optional
+# `h2` package (`pip install httpx[http2]`); fall back to HTTP/1.1 keep-alive without it
+HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Size of each chunk read from the response stream and written to disk
+CHUNK_SIZE = 64 * 1024
+
 # Stations and years used in documentation examples
 # Format: (station_id, [years]) - buffer years (±1) are automatically added
 EXAMPLE_STATIONS = [
@@ -36,45 +57,116 @@ def _get_years_with_buffers(years: list[int]) -> list[int]:
     return sorted(all_years)
 
 
+async def _fetch(
+    client: httpx.AsyncClient, data_dir: Path, existing: set[str], station_id: str, year: int
+) -> str:
+    """Download a single station-year file and return its status line.
+
+    `existing` is a snapshot of the file names in `data_dir` taken before any
+    downloads start, so no per-file `stat()` is needed to skip finished files.
+    """
+    filename = f"{station_id}-{year}.gz"
+    filepath = data_dir / filename
+    url = f"{BASE_URL}/{year}/{filename}"
+
+    if filename in existing:
+        return f"  ✓ {filename} (already exists)"
+
+    # Downloads land in a `.part` file that is only renamed into place once complete,
+    # so an existing final file can always be trusted; a leftover `.part` from an
+    # interrupted run is resumed with a Range request
+    partpath = filepath.with_name(filename + ".part")
+    offset = partpath.stat().st_size if partpath.name in existing else 0
+    headers = {"Range": f"bytes={offset}-"} if offset else None
+
+    try:
+        # Stream the body to disk so only one chunk per download is held in memory
+        size = 0
+        async with client.stream("GET", url, headers=headers) as response:
+            if response.status_code == 416:
+                # Range not satisfiable: the partial file is stale, start over next run
+                partpath.unlink(missing_ok=True)
+            response.raise_for_status()
+            # Servers that ignore the Range header send the whole file again
+            resumed = offset and response.status_code == 206
+            # File I/O runs in a worker thread so that a slow disk write doesn't stall the
+            # other transfers sharing the event loop
+            f = await asyncio.to_thread(open, partpath, "ab" if resumed else "wb")
+            try:
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    await asyncio.to_thread(f.write, chunk)
+                    size += len(chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+        # The .part file sits next to its destination, so this is a metadata-only
+        # rename; the body is never copied a second time after being streamed in
+        os.replace(partpath, filepath)
+        if resumed:
+            return f"  ↓ {filename} ({size / 1024:.1f} KB, resumed at {offset / 1024:.1f} KB)"
+        return f"  ↓ {filename} ({size / 1024:.1f} KB)"
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            return f"  - {filename} (not available - OK for buffer year)"
+        return f"  ✗ {filename} FAILED: {e}"
+    except httpx.HTTPError as e:
+        return f"  ✗ {filename} FAILED: {e} (partial download kept for resume)"
+    except Exception as e:
+        # Anything else (e.g. an OSError on the .part file) fails just this file rather than
+        # aborting the whole run before any status lines are printed
+        return f"  ✗ {filename} FAILED: {e!r}"
+
+
+def _report_progress(done: int, total: int) -> None:
+    """Redraw a single-line progress counter on stderr when it's a terminal."""
+    if not sys.stderr.isatty():
+        return
+    end = "\n" if done == total else ""
+    sys.stderr.write(f"\r  {done}/{total} files{end}")
+    sys.stderr.flush()
+
+
+async def _adownload(data_dir: Path, sample_data: Iterable[tuple[str, int]]) -> list[str]:
+    """Download all sample files concurrently, returning status lines in input order."""
+    existing = {entry.name for entry in os.scandir(data_dir)}
+    limits = httpx.Limits(
+        max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS
+    )
+
+    async with httpx.AsyncClient(
+        http2=HTTP2, timeout=120.0, follow_redirects=True, limits=limits
+    ) as client:
+        tasks = [
+            asyncio.create_task(_fetch(client, data_dir, existing, station_id, year))
+            for station_id, year in sample_data
+        ]
+        # Results are read back from the tasks so status lines stay in input order
+        for done, completed in enumerate(asyncio.as_completed(tasks), start=1):
+            await completed
+            _report_progress(done, len(tasks))
+        return [task.result() for task in tasks]
+
+
 def download_sample_data():
     """Download sample data files to the package data directory."""
     data_dir = Path(__file__).parent.parent / "weathervault" / "data"
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build full list with buffer years
-    sample_data = []
-    for station_id, years in EXAMPLE_STATIONS:
-        for year in _get_years_with_buffers(years):
-            sample_data.append((station_id, year))
+    # Build full list with buffer years; a dict keeps insertion order while dropping
+    # duplicate (station_id, year) pairs that concurrent downloads couldn't dedupe
+    sample_data = dict.fromkeys(
+        (station_id, year)
+        for station_id, years in EXAMPLE_STATIONS
+        for year in _get_years_with_buffers(years)
+    )
 
     print(f"Downloading sample data to: {data_dir}")
     print("(includes buffer years for timezone handling)")
     print()
 
-    with httpx.Client(timeout=120.0, follow_redirects=True) as client:
-        for station_id, year in sample_data:
-            filename = f"{station_id}-{year}.gz"
-            filepath = data_dir / filename
-            url = f"{BASE_URL}/{year}/{filename}"
-
-            if filepath.exists():
-                print(f"  ✓ {filename} (already exists)")
-                continue
-
-            print(f"  ↓ Downloading {filename}...", end=" ", flush=True)
-            try:
-                response = client.get(url)
-                response.raise_for_status()
-                filepath.write_bytes(response.content)
-                size_kb = len(response.content) / 1024
-                print(f"({size_kb:.1f} KB)")
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    print("(not available - OK for buffer year)")
-                else:
-                    print(f"FAILED: {e}")
-            except httpx.HTTPError as e:
-                print(f"FAILED: {e}")
+    # Status lines are collected and printed together so that concurrent
+    # downloads don't interleave their output
+    for line in asyncio.run(_adownload(data_dir, sample_data)):
+        print(line)
 
     print()
     print("Done! Sample data is ready for documentation builds.")
@@ -0,0 +1,105 @@
+"""Shared fixtures for the test suite."""
+
+import os
+from pathlib import Path
+
+import polars as pl
+import pytest
+
+from weathervault.stations import get_years_for_station
+from weathervault.weather import get_weather_data
+
+# LaGuardia Airport, used throughout the weather tests
+LGA = "725030-14732"
+
+
+def pytest_addoption(parser):
+    """Add the `--run-network` option."""
+    parser.addoption(
+        "--run-network",
+        action="store_true",
+        default=False,
+        help="run tests marked 'network' (also enabled by setting RUN_NETWORK=1)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip network tests unless they were explicitly requested."""
+    if config.getoption("--run-network") or os.environ.get("RUN_NETWORK") == "1":
+        return
+    skip_network = pytest.mark.skip(reason="needs network access; pass --run-network to run")
+    for item in items:
+        if "network" in item.keywords:
+            item.add_marker(skip_network)
+
+
+@pytest.fixture(scope="session")
+def isd_cache_dir(request, tmp_path_factory) -> Path:
+    """Directory where downloaded ISD files are kept between test runs.
+
+    Lives in pytest's cache (`.pytest_cache/d/isd`, cleared by `pytest --cache-clear`) so
+    that repeat runs read station-years from disk instead of downloading them again. Setting
+    `WEATHERVAULT_TEST_CACHE` points it at a directory that outlives the checkout (e.g.
+    `~/.cache/weathervault-tests`). Falls back to a per-session temporary directory when the
+    cache plugin is disabled.
+    """
+    if env_dir := os.environ.get("WEATHERVAULT_TEST_CACHE"):
+        path = Path(env_dir).expanduser()
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+    cache = getattr(request.config, "cache", None)
+    if cache is None:
+        return tmp_path_factory.mktemp("isd")
+    return cache.mkdir("isd")
+
+
+@pytest.fixture(scope="session")
+def lga_years() -> list[int]:
+    """Years with LaGuardia data in the NCEI inventory, looked up once per session."""
+    return get_years_for_station(LGA)
+
+
+# Each fixture fetches and parses one variant of the LaGuardia data once per session; tests must
+# treat the returned DataFrames as read-only since they're shared
+
+
+@pytest.fixture(scope="session")
+def lga_2023(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data with default options (Celsius, local time)."""
+    return get_weather_data(LGA, years=2023, cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2023_utc(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data kept in UTC."""
+    return get_weather_data(LGA, years=2023, convert_to_local=False, cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2023_f(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data in Fahrenheit."""
+    return get_weather_data(LGA, years=2023, temp_unit="fahrenheit", cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2023_k(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data in Kelvin."""
+    return get_weather_data(LGA, years=2023, temp_unit="kelvin", cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2023_hourly(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data resampled to hourly."""
+    return get_weather_data(LGA, years=2023, make_hourly=True, cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2023_stn_info(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia 2023 data with station metadata columns."""
+    return get_weather_data(LGA, years=2023, incl_stn_info=True, cache_dir=isd_cache_dir)
+
+
+@pytest.fixture(scope="session")
+def lga_2022_2023(isd_cache_dir) -> pl.DataFrame:
+    """LaGuardia data for 2022 and 2023."""
+    return get_weather_data(LGA, years=[2022, 2023], cache_dir=isd_cache_dir)
@@ -1,14 +1,26 @@
 """Tests for the constants module."""
 
+import copy
+import pickle
+
+import polars as pl
+import pytest
+
 from weathervault._constants import (
     BASE_URL,
     COUNTRY_CODES,
+    ISO_COUNTRY_NAMES,
     MANDATORY_COLUMN_NAMES,
+    MANDATORY_COLUMN_OFFSETS,
     MANDATORY_COLUMN_WIDTHS,
+    MANDATORY_SECTION_LENGTH,
     MISSING_VALUES,
     SCALE_FACTORS,
+    US_STATE_NAMES,
 )
 
+_NAMES = frozenset(MANDATORY_COLUMN_NAMES)
+
 
 class TestBaseUrl:
     """Tests for BASE_URL constant."""
@@ -37,17 +49,31 @@ class TestColumnWidths:
     def test_column_widths_sum(self):
         """Test that column widths sum to expected mandatory section length."""
         # The mandatory section is 105 characters
-        assert sum(MANDATORY_COLUMN_WIDTHS) == 105
+        assert MANDATORY_SECTION_LENGTH == 105
+        assert sum(MANDATORY_COLUMN_WIDTHS) == MANDATORY_SECTION_LENGTH
+
+    def test_column_offsets(self):
+        """Test that column offsets are the running totals of the widths."""
+        assert len(MANDATORY_COLUMN_OFFSETS) == len(MANDATORY_COLUMN_WIDTHS) + 1
+        assert MANDATORY_COLUMN_OFFSETS[0] == 0
+        assert MANDATORY_COLUMN_OFFSETS[-1] == MANDATORY_SECTION_LENGTH
+        assert all(
+            end - start == width
+            for start, end, width in zip(
+                MANDATORY_COLUMN_OFFSETS[:-1],
+                MANDATORY_COLUMN_OFFSETS[1:],
+                MANDATORY_COLUMN_WIDTHS,
+                strict=True,
+            )
+        )
 
     def test_column_widths_positive(self):
         """Test that all column widths are positive integers."""
-        for width in MANDATORY_COLUMN_WIDTHS:
-            assert isinstance(width, int)
-            assert width > 0
+        assert all(isinstance(width, int) and width > 0 for width in MANDATORY_COLUMN_WIDTHS)
 
     def test_mandatory_column_names_unique(self):
         """Test that column names are unique."""
-        assert len(MANDATORY_COLUMN_NAMES) == len(set(MANDATORY_COLUMN_NAMES))
+        assert len(MANDATORY_COLUMN_NAMES) == len(_NAMES)
 
     def test_expected_column_names_present(self):
         """Test that key column names are present."""
@@ -67,8 +93,7 @@ class TestColumnWidths:
             "ceiling_height",
             "sea_level_pressure",
         ]
-        for name in expected:
-            assert name in MANDATORY_COLUMN_NAMES
+        assert frozenset(expected) <= _NAMES, frozenset(expected) - _NAMES
 
 
 class TestCountryCodes:
@@ -80,15 +105,19 @@ class TestCountryCodes:
 
     def test_country_codes_format(self):
         """Test that country codes are 2-character strings."""
-        for code in COUNTRY_CODES:
-            assert len(code) == 2
-            assert code.isupper()
-
-    def test_country_names_not_empty(self):
+        codes = pl.Series("code", list(COUNTRY_CODES))
+        # Same predicate as `len(code) == 2 and code.isupper()`, over the whole column
+        valid = (
+            (codes.str.len_chars() == 2)
+            & (codes == codes.str.to_uppercase())
+            & codes.str.contains("[A-Z]")
+        )
+        assert valid.all(), codes.filter(~valid).to_list()
+
+    @pytest.mark.parametrize("code,name", COUNTRY_CODES.items())
+    def test_country_names_not_empty(self, code, name):
         """Test that country names are non-empty strings."""
-        for name in COUNTRY_CODES.values():
-            assert isinstance(name, str)
-            assert len(name) > 0
+        assert isinstance(name, str) and len(name) > 0
 
     def test_known_country_codes(self):
         """Test some known country code mappings."""
@@ -111,6 +140,23 @@ class TestCountryCodes:
         assert len(unique_names) > len(names) * 0.9
 
 
+class TestReadOnlyMappings:
+    """Tests for which lookup tables are read-only."""
+
+    @pytest.mark.parametrize("mapping", [MISSING_VALUES, SCALE_FACTORS])
+    def test_mapping_is_read_only(self, mapping):
+        """Test that item assignment on an internal constant mapping raises TypeError."""
+        with pytest.raises(TypeError):
+            mapping["XX"] = 1
+
+    @pytest.mark.parametrize("mapping", [COUNTRY_CODES, ISO_COUNTRY_NAMES, US_STATE_NAMES])
+    def test_public_tables_are_dicts(self, mapping):
+        """Test that the tables re-exported by the package can be copied like plain dicts."""
+        assert type(mapping) is dict
+        assert copy.deepcopy(mapping) == mapping
+        assert pickle.loads(pickle.dumps(mapping)) == mapping
+
+
 class TestMissingValues:
     """Tests for MISSING_VALUES constant."""
 
@@ -127,22 +173,21 @@ class TestMissingValues:
         }
         assert set(MISSING_VALUES.keys()) == expected_keys
 
-    def test_missing_values_are_integers(self):
+    @pytest.mark.parametrize("key,value", MISSING_VALUES.items())
+    def test_missing_values_are_integers(self, key, value):
         """Test that missing values are integers."""
-        for value in MISSING_VALUES.values():
-            assert isinstance(value, int)
+        assert isinstance(value, int)
 
     def test_missing_values_are_positive(self):
         """Test that missing values are positive (they're typically 9-filled)."""
-        for value in MISSING_VALUES.values():
-            assert value > 0
+        assert all(value > 0 for value in MISSING_VALUES.values())
 
     def test_missing_values_pattern(self):
         """Test that missing values follow the 9-filled pattern."""
         # ISD uses 9s for missing values
         for key, value in MISSING_VALUES.items():
-            str_value = str(value)
-            assert all(c == "9" for c in str_value), f"{key} should be all 9s"
+            # An all-9s number is exactly one less than a power of ten
+            assert value + 1 == 10 ** len(str(value)), f"{key} should be all 9s"
 
 
 class TestScaleFactors:
@@ -161,15 +206,14 @@ class TestScaleFactors:
         }
         assert set(SCALE_FACTORS.keys()) == expected_keys
 
-    def test_scale_factors_are_positive(self):
+    @pytest.mark.parametrize("key,value", SCALE_FACTORS.items())
+    def test_scale_factors_are_positive(self, key, value):
         """Test that scale factors are positive numbers."""
-        for value in SCALE_FACTORS.values():
-            assert value > 0
+        assert value > 0
 
     def test_scale_factors_are_numeric(self):
         """Test that scale factors are integers or floats."""
-        for value in SCALE_FACTORS.values():
-            assert isinstance(value, (int, float))
+        assert all(isinstance(value, (int, float)) for value in SCALE_FACTORS.values())
 
     def test_temperature_scale_factor(self):
         """Test that temperature scale factor is 10 (for 1 decimal place)."""
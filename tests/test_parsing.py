@@ -1,7 +1,11 @@
 """Tests for the parsing module."""
 
+import gzip
+from functools import cache
+
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
 from weathervault._constants import MANDATORY_COLUMN_NAMES
 from weathervault._parsing import (
@@ -12,53 +16,113 @@ from weathervault._parsing import (
     process_weather_data,
 )
 
+# Example ISD line (105 characters for mandatory section)
+# Build the line according to exact column widths:
+# 4+6+5+4+2+2+2+2+1+6+7+5+5+5+4+3+1+1+4+1+5+1+1+1+6+1+1+1+5+1+5+1+5+1 = 105
+_VALID_LINE = (
+    "0105"  # Total variable length (4)
+    "725030"  # USAF (6)
+    "14732"  # WBAN (5)
+    "2023"  # Year (4)
+    "07"  # Month (2)
+    "15"  # Day (2)
+    "14"  # Hour (2)
+    "00"  # Minute (2)
+    "4"  # Data source (1)
+    "+40750"  # Latitude (6)
+    "-073900"  # Longitude (7)
+    "FM-15"  # Report type (5)
+    "+0003"  # Elevation (5)
+    "KLGA "  # Call letters (5 with padding)
+    "V020"  # QC process (4)
+    "270"  # Wind direction (3)
+    "1"  # Wind direction QC (1)
+    "N"  # Wind type (1)
+    "0051"  # Wind speed (4)
+    "1"  # Wind speed QC (1)
+    "22000"  # Ceiling height (5)
+    "1"  # Ceiling height QC (1)
+    "9"  # Ceiling determination (1)
+    "N"  # CAVOK (1)
+    "016093"  # Visibility (6)
+    "1"  # Visibility QC (1)
+    "N"  # Visibility variability (1)
+    "9"  # Visibility variability QC (1)
+    "+0261"  # Temperature (5)
+    "1"  # Temperature QC (1)
+    "+0172"  # Dew point (5)
+    "1"  # Dew point QC (1)
+    "10132"  # Sea level pressure (5)
+    "1"  # Sea level pressure QC (1)
+)
+
+# Line with some empty/whitespace fields (padded with spaces)
+_EMPTY_FIELDS_LINE = "0105" + " " * 101
+
+# Line shorter than the mandatory section
+_SHORT_LINE = "0105725030147322023"
+
+# Row order of the lines in the shared parsed frame; the padded line must not come
+# last, since surrounding whitespace is stripped from the whole input
+_LINE_CASES = (_VALID_LINE, _EMPTY_FIELDS_LINE, _SHORT_LINE)
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    """Parse all example lines together in a single parse_isd_data call."""
+    return parse_isd_data("\n".join(_LINE_CASES))
+
+
+# Raw-field overrides for each process_weather_data case; all cases are stacked into
+# one frame and processed together, so each case's output is the row at its position
+_PROCESS_CASES = {
+    "summer": {"temp": "+0261", "dew_point": "+0172", "wind_speed": "0051"},
+    "all_missing": {
+        "temp": "+9999",
+        "dew_point": "+9999",
+        "wind_direction": "999",
+        "wind_speed": "9999",
+        "ceiling_height": "99999",
+        "visibility": "999999",
+        "sea_level_pressure": "99999",
+    },
+    "hot_humid": {"temp": "+0300", "dew_point": "+0250"},  # 30°C, 25°C dew point
+    "cold_dry": {"temp": "-0100", "dew_point": "-0150"},  # -10°C, -15°C dew point
+    "saturated": {"temp": "+0200", "dew_point": "+0200"},  # Same temp and dew point
+    "freezing": {"temp": "-0150", "dew_point": "-0200"},  # -15°C, -20°C
+}
+_PROCESS_CASE_ROWS = {name: i for i, name in enumerate(_PROCESS_CASES)}
+
+
+@pytest.fixture(scope="module")
+def raw_cases():
+    """Stack one raw row per entry in _PROCESS_CASES."""
+    return pl.concat([_create_test_dataframe(**overrides) for overrides in _PROCESS_CASES.values()])
+
+
+@pytest.fixture(scope="module")
+def processed_celsius(raw_cases):
+    """Process all cases once with Celsius output."""
+    return process_weather_data(raw_cases, temp_unit="celsius")
+
+
+@pytest.fixture(scope="module")
+def processed_fahrenheit(raw_cases):
+    """Process all cases once with Fahrenheit output."""
+    return process_weather_data(raw_cases, temp_unit="fahrenheit")
+
+
+def _case_row(processed: pl.DataFrame, case: str) -> dict:
+    """Return the processed row for a named case."""
+    return processed.row(_PROCESS_CASE_ROWS[case], named=True)
+
 
 class TestParseIsdLine:
     """Tests for parse_isd_line function."""
 
-    def test_parse_valid_line(self):
+    def test_parse_valid_line(self, parsed):
         """Test parsing a valid ISD line."""
-        # Example ISD line (105 characters for mandatory section)
-        # Build the line according to exact column widths:
-        # 4+6+5+4+2+2+2+2+1+6+7+5+5+5+4+3+1+1+4+1+5+1+1+1+6+1+1+1+5+1+5+1+5+1 = 105
-        line = (
-            "0105"  # Total variable length (4)
-            "725030"  # USAF (6)
-            "14732"  # WBAN (5)
-            "2023"  # Year (4)
-            "07"  # Month (2)
-            "15"  # Day (2)
-            "14"  # Hour (2)
-            "00"  # Minute (2)
-            "4"  # Data source (1)
-            "+40750"  # Latitude (6)
-            "-073900"  # Longitude (7)
-            "FM-15"  # Report type (5)
-            "+0003"  # Elevation (5)
-            "KLGA "  # Call letters (5 with padding)
-            "V020"  # QC process (4)
-            "270"  # Wind direction (3)
-            "1"  # Wind direction QC (1)
-            "N"  # Wind type (1)
-            "0051"  # Wind speed (4)
-            "1"  # Wind speed QC (1)
-            "22000"  # Ceiling height (5)
-            "1"  # Ceiling height QC (1)
-            "9"  # Ceiling determination (1)
-            "N"  # CAVOK (1)
-            "016093"  # Visibility (6)
-            "1"  # Visibility QC (1)
-            "N"  # Visibility variability (1)
-            "9"  # Visibility variability QC (1)
-            "+0261"  # Temperature (5)
-            "1"  # Temperature QC (1)
-            "+0172"  # Dew point (5)
-            "1"  # Dew point QC (1)
-            "10132"  # Sea level pressure (5)
-            "1"  # Sea level pressure QC (1)
-        )
-
-        result = parse_isd_line(line)
+        result = parsed.row(_LINE_CASES.index(_VALID_LINE), named=True)
 
         assert result["usaf"] == "725030"
         assert result["wban"] == "14732"
@@ -72,10 +136,9 @@ class TestParseIsdLine:
         assert result["temp"] == "+0261"
         assert result["dew_point"] == "+0172"
 
-    def test_parse_short_line(self):
+    def test_parse_short_line(self, parsed):
         """Test parsing a line shorter than expected."""
-        short_line = "0105725030147322023"
-        result = parse_isd_line(short_line)
+        result = parsed.row(_LINE_CASES.index(_SHORT_LINE), named=True)
 
         # First few fields should be parsed
         assert result["total_chars"] == "0105"
@@ -83,15 +146,18 @@ class TestParseIsdLine:
         # Later fields should be None
         assert result["temp"] is None
 
-    def test_parse_empty_fields(self):
+    def test_parse_empty_fields(self, parsed):
         """Test that empty fields are returned as None."""
-        # Line with some empty/whitespace fields
-        line = "0105" + " " * 101  # Padded with spaces
-        result = parse_isd_line(line)
+        result = parsed.row(_LINE_CASES.index(_EMPTY_FIELDS_LINE), named=True)
 
         # Empty fields should be None
         assert result["usaf"] is None
 
+    @pytest.mark.parametrize("index", range(len(_LINE_CASES)))
+    def test_rows_match_parse_isd_line(self, parsed, index):
+        """Test that each parsed row matches parsing the line on its own."""
+        assert parsed.row(index, named=True) == parse_isd_line(_LINE_CASES[index])
+
 
 class TestParseIsdData:
     """Tests for parse_isd_data function."""
@@ -135,6 +201,12 @@ class TestParseIsdData:
         assert isinstance(result, pl.DataFrame)
         assert result.height == 1
 
+    def test_parse_gzipped_data(self, parsed):
+        """Test that gzipped bytes parse the same as the plain text."""
+        data = gzip.compress("\n".join(_LINE_CASES).encode("utf-8"))
+
+        assert_frame_equal(parse_isd_data(data), parsed)
+
 
 class TestProcessWeatherData:
     """Tests for process_weather_data function."""
@@ -147,195 +219,43 @@ class TestProcessWeatherData:
         assert isinstance(result, pl.DataFrame)
         assert result.height == 0
 
-    def test_temperature_conversion(self):
+    def test_temperature_conversion(self, processed_celsius):
         """Test that temperature values are scaled correctly."""
-        # Create a minimal DataFrame with temperature data
-        df = pl.DataFrame(
-            {
-                "usaf": ["725030"],
-                "wban": ["14732"],
-                "year": ["2023"],
-                "month": ["07"],
-                "day": ["15"],
-                "hour": ["14"],
-                "minute": ["00"],
-                "wind_direction": ["270"],
-                "wind_speed": ["0051"],
-                "ceiling_height": ["22000"],
-                "visibility": ["016093"],
-                "temp": ["+0261"],  # 26.1°C
-                "dew_point": ["+0172"],  # 17.2°C
-                "sea_level_pressure": ["10132"],  # 1013.2 hPa
-                # Fill in other required columns with defaults
-                "total_chars": ["0105"],
-                "data_source": ["4"],
-                "latitude": ["+40750"],
-                "longitude": ["-073900"],
-                "report_type": ["FM-15"],
-                "elevation": ["+0003"],
-                "call_letters": ["KLGA"],
-                "qc_process": ["V020"],
-                "wind_direction_qc": ["1"],
-                "wind_type": ["N"],
-                "wind_speed_qc": ["1"],
-                "ceiling_height_qc": ["1"],
-                "ceiling_determination": ["9"],
-                "cavok": ["N"],
-                "visibility_qc": ["1"],
-                "visibility_variability": ["N"],
-                "visibility_variability_qc": ["9"],
-                "temp_qc": ["1"],
-                "dew_point_qc": ["1"],
-                "sea_level_pressure_qc": ["1"],
-            }
-        )
-
-        result = process_weather_data(df, temp_unit="celsius")
+        result = _case_row(processed_celsius, "summer")
 
-        assert result["temp"][0] == pytest.approx(26.1, rel=0.01)
-        assert result["dew_point"][0] == pytest.approx(17.2, rel=0.01)
+        assert result["temp"] == pytest.approx(26.1, rel=0.01)
+        assert result["dew_point"] == pytest.approx(17.2, rel=0.01)
 
-    def test_fahrenheit_conversion(self):
+    def test_fahrenheit_conversion(self, processed_fahrenheit):
         """Test temperature conversion to Fahrenheit."""
-        df = pl.DataFrame(
-            {
-                "usaf": ["725030"],
-                "wban": ["14732"],
-                "year": ["2023"],
-                "month": ["07"],
-                "day": ["15"],
-                "hour": ["14"],
-                "minute": ["00"],
-                "wind_direction": ["270"],
-                "wind_speed": ["0051"],
-                "ceiling_height": ["22000"],
-                "visibility": ["016093"],
-                "temp": ["+0261"],  # 26.1°C = 79.0°F
-                "dew_point": ["+0172"],  # 17.2°C = 63.0°F
-                "sea_level_pressure": ["10132"],
-                "total_chars": ["0105"],
-                "data_source": ["4"],
-                "latitude": ["+40750"],
-                "longitude": ["-073900"],
-                "report_type": ["FM-15"],
-                "elevation": ["+0003"],
-                "call_letters": ["KLGA"],
-                "qc_process": ["V020"],
-                "wind_direction_qc": ["1"],
-                "wind_type": ["N"],
-                "wind_speed_qc": ["1"],
-                "ceiling_height_qc": ["1"],
-                "ceiling_determination": ["9"],
-                "cavok": ["N"],
-                "visibility_qc": ["1"],
-                "visibility_variability": ["N"],
-                "visibility_variability_qc": ["9"],
-                "temp_qc": ["1"],
-                "dew_point_qc": ["1"],
-                "sea_level_pressure_qc": ["1"],
-            }
-        )
-
-        result = process_weather_data(df, temp_unit="fahrenheit")
+        result = _case_row(processed_fahrenheit, "summer")
 
         # 26.1°C = 78.98°F
-        assert result["temp"][0] == pytest.approx(79.0, rel=0.1)
+        assert result["temp"] == pytest.approx(79.0, rel=0.1)
 
-    def test_missing_values_converted_to_null(self):
+    def test_missing_values_converted_to_null(self, processed_celsius):
         """Test that missing value codes are converted to null."""
-        df = pl.DataFrame(
-            {
-                "usaf": ["725030"],
-                "wban": ["14732"],
-                "year": ["2023"],
-                "month": ["07"],
-                "day": ["15"],
-                "hour": ["14"],
-                "minute": ["00"],
-                "wind_direction": ["999"],  # Missing value
-                "wind_speed": ["9999"],  # Missing value
-                "ceiling_height": ["99999"],  # Missing value
-                "visibility": ["999999"],  # Missing value
-                "temp": ["+9999"],  # Missing value
-                "dew_point": ["+9999"],  # Missing value
-                "sea_level_pressure": ["99999"],  # Missing value
-                "total_chars": ["0105"],
-                "data_source": ["4"],
-                "latitude": ["+40750"],
-                "longitude": ["-073900"],
-                "report_type": ["FM-15"],
-                "elevation": ["+0003"],
-                "call_letters": ["KLGA"],
-                "qc_process": ["V020"],
-                "wind_direction_qc": ["9"],
-                "wind_type": ["9"],
-                "wind_speed_qc": ["9"],
-                "ceiling_height_qc": ["9"],
-                "ceiling_determination": ["9"],
-                "cavok": ["N"],
-                "visibility_qc": ["9"],
-                "visibility_variability": ["N"],
-                "visibility_variability_qc": ["9"],
-                "temp_qc": ["9"],
-                "dew_point_qc": ["9"],
-                "sea_level_pressure_qc": ["9"],
-            }
-        )
+        result = _case_row(processed_celsius, "all_missing")
 
-        result = process_weather_data(df)
-
-        assert result["wd"][0] is None
-        assert result["ws"][0] is None
-        assert result["ceil_hgt"][0] is None
-        assert result["visibility"][0] is None
-        assert result["temp"][0] is None
-        assert result["dew_point"][0] is None
-        assert result["atmos_pres"][0] is None
+        assert result["wd"] is None
+        assert result["ws"] is None
+        assert result["ceil_hgt"] is None
+        assert result["visibility"] is None
+        assert result["temp"] is None
+        assert result["dew_point"] is None
+        assert result["atmos_pres"] is None
 
-    def test_wind_speed_scaling(self):
+    def test_wind_speed_scaling(self, processed_celsius):
         """Test that wind speed is scaled correctly (divide by 10)."""
-        df = pl.DataFrame(
-            {
-                "usaf": ["725030"],
-                "wban": ["14732"],
-                "year": ["2023"],
-                "month": ["07"],
-                "day": ["15"],
-                "hour": ["14"],
-                "minute": ["00"],
-                "wind_direction": ["270"],
-                "wind_speed": ["0051"],  # 5.1 m/s
-                "ceiling_height": ["22000"],
-                "visibility": ["016093"],
-                "temp": ["+0261"],
-                "dew_point": ["+0172"],
-                "sea_level_pressure": ["10132"],
-                "total_chars": ["0105"],
-                "data_source": ["4"],
-                "latitude": ["+40750"],
-                "longitude": ["-073900"],
-                "report_type": ["FM-15"],
-                "elevation": ["+0003"],
-                "call_letters": ["KLGA"],
-                "qc_process": ["V020"],
-                "wind_direction_qc": ["1"],
-                "wind_type": ["N"],
-                "wind_speed_qc": ["1"],
-                "ceiling_height_qc": ["1"],
-                "ceiling_determination": ["9"],
-                "cavok": ["N"],
-                "visibility_qc": ["1"],
-                "visibility_variability": ["N"],
-                "visibility_variability_qc": ["9"],
-                "temp_qc": ["1"],
-                "dew_point_qc": ["1"],
-                "sea_level_pressure_qc": ["1"],
-            }
-        )
+        result = _case_row(processed_celsius, "summer")
 
-        result = process_weather_data(df)
+        assert result["ws"] == pytest.approx(5.1, rel=0.01)
 
-        assert result["ws"][0] == pytest.approx(5.1, rel=0.01)
+    def test_batch_matches_single_row(self, raw_cases, processed_celsius):
+        """Test that processing cases together gives the same rows as one at a time."""
+        for i in range(raw_cases.height):
+            single = process_weather_data(raw_cases.slice(i, 1), temp_unit="celsius")
+            assert_frame_equal(single, processed_celsius.slice(i, 1))
 
 
 class TestEmptyDataFrames:
@@ -434,44 +354,36 @@ class TestEmptyDataFrames:
 class TestRelativeHumidityCalculation:
     """Tests for relative humidity calculation."""
 
-    def test_rh_calculation_hot_humid(self):
+    def test_rh_calculation_hot_humid(self, processed_celsius):
         """Test RH calculation for hot humid conditions."""
-        df = _create_test_dataframe(temp="+0300", dew_point="+0250")  # 30°C, 25°C dew point
-        result = process_weather_data(df)
         # At 30°C with 25°C dew point, RH should be around 75%
-        assert 70 < result["rh"][0] < 80
+        assert 70 < _case_row(processed_celsius, "hot_humid")["rh"] < 80
 
-    def test_rh_calculation_cold_dry(self):
+    def test_rh_calculation_cold_dry(self, processed_celsius):
         """Test RH calculation for cold dry conditions."""
-        df = _create_test_dataframe(temp="-0100", dew_point="-0150")  # -10°C, -15°C dew point
-        result = process_weather_data(df)
         # Should have lower relative humidity
-        assert 50 < result["rh"][0] < 80
+        assert 50 < _case_row(processed_celsius, "cold_dry")["rh"] < 80
 
-    def test_rh_calculation_saturated(self):
+    def test_rh_calculation_saturated(self, processed_celsius):
         """Test RH calculation when temp equals dew point (100% RH)."""
-        df = _create_test_dataframe(temp="+0200", dew_point="+0200")  # Same temp and dew point
-        result = process_weather_data(df)
         # Should be 100% (or very close)
-        assert result["rh"][0] == pytest.approx(100.0, rel=0.01)
+        rh = _case_row(processed_celsius, "saturated")["rh"]
+        assert rh == pytest.approx(100.0, rel=0.01)
 
 
 class TestNegativeTemperatures:
     """Tests for handling negative temperatures."""
 
-    def test_negative_temperature_parsing(self):
+    def test_negative_temperature_parsing(self, processed_celsius):
         """Test that negative temperatures are parsed correctly."""
-        df = _create_test_dataframe(temp="-0150", dew_point="-0200")  # -15°C, -20°C
-        result = process_weather_data(df)
-        assert result["temp"][0] == pytest.approx(-15.0, rel=0.01)
-        assert result["dew_point"][0] == pytest.approx(-20.0, rel=0.01)
+        result = _case_row(processed_celsius, "freezing")
+        assert result["temp"] == pytest.approx(-15.0, rel=0.01)
+        assert result["dew_point"] == pytest.approx(-20.0, rel=0.01)
 
-    def test_negative_temperature_fahrenheit(self):
+    def test_negative_temperature_fahrenheit(self, processed_fahrenheit):
         """Test negative temperature conversion to Fahrenheit."""
-        df = _create_test_dataframe(temp="-0100", dew_point="-0150")  # -10°C
-        result = process_weather_data(df, temp_unit="fahrenheit")
         # -10°C = 14°F
-        assert result["temp"][0] == pytest.approx(14.0, rel=0.1)
+        assert _case_row(processed_fahrenheit, "cold_dry")["temp"] == pytest.approx(14.0, rel=0.1)
 
 
 class TestEdgeCases:
@@ -539,48 +451,96 @@ class TestEdgeCases:
         assert result["temp"] == "+0261"
 
 
-def _create_test_dataframe(
-    temp: str = "+0261",
-    dew_point: str = "+0172",
-    wind_direction: str = "270",
-    wind_speed: str = "0051",
-) -> pl.DataFrame:
-    """Helper function to create a test DataFrame with weather data."""
-    return pl.DataFrame(
-        {
-            "usaf": ["725030"],
-            "wban": ["14732"],
-            "year": ["2023"],
-            "month": ["07"],
-            "day": ["15"],
-            "hour": ["14"],
-            "minute": ["00"],
-            "wind_direction": [wind_direction],
-            "wind_speed": [wind_speed],
-            "ceiling_height": ["22000"],
-            "visibility": ["016093"],
-            "temp": [temp],
-            "dew_point": [dew_point],
-            "sea_level_pressure": ["10132"],
-            "total_chars": ["0105"],
-            "data_source": ["4"],
-            "latitude": ["+40750"],
-            "longitude": ["-073900"],
-            "report_type": ["FM-15"],
-            "elevation": ["+0003"],
-            "call_letters": ["KLGA"],
-            "qc_process": ["V020"],
-            "wind_direction_qc": ["1"],
-            "wind_type": ["N"],
-            "wind_speed_qc": ["1"],
-            "ceiling_height_qc": ["1"],
-            "ceiling_determination": ["9"],
-            "cavok": ["N"],
-            "visibility_qc": ["1"],
-            "visibility_variability": ["N"],
-            "visibility_variability_qc": ["9"],
-            "temp_qc": ["1"],
-            "dew_point_qc": ["1"],
-            "sea_level_pressure_qc": ["1"],
-        }
+# Raw column names and their default values; tests override only the fields they vary
+_COLS: tuple[str, ...] = (
+    "usaf",
+    "wban",
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "wind_direction",
+    "wind_speed",
+    "ceiling_height",
+    "visibility",
+    "temp",
+    "dew_point",
+    "sea_level_pressure",
+    "total_chars",
+    "data_source",
+    "latitude",
+    "longitude",
+    "report_type",
+    "elevation",
+    "call_letters",
+    "qc_process",
+    "wind_direction_qc",
+    "wind_type",
+    "wind_speed_qc",
+    "ceiling_height_qc",
+    "ceiling_determination",
+    "cavok",
+    "visibility_qc",
+    "visibility_variability",
+    "visibility_variability_qc",
+    "temp_qc",
+    "dew_point_qc",
+    "sea_level_pressure_qc",
+)
+_DEFAULTS: tuple[str, ...] = (
+    "725030",  # usaf
+    "14732",  # wban
+    "2023",  # year
+    "07",  # month
+    "15",  # day
+    "14",  # hour
+    "00",  # minute
+    "270",  # wind_direction
+    "0051",  # wind_speed
+    "22000",  # ceiling_height
+    "016093",  # visibility
+    "+0261",  # temp
+    "+0172",  # dew_point
+    "10132",  # sea_level_pressure
+    "0105",  # total_chars
+    "4",  # data_source
+    "+40750",  # latitude
+    "-073900",  # longitude
+    "FM-15",  # report_type
+    "+0003",  # elevation
+    "KLGA",  # call_letters
+    "V020",  # qc_process
+    "1",  # wind_direction_qc
+    "N",  # wind_type
+    "1",  # wind_speed_qc
+    "1",  # ceiling_height_qc
+    "9",  # ceiling_determination
+    "N",  # cavok
+    "1",  # visibility_qc
+    "N",  # visibility_variability
+    "9",  # visibility_variability_qc
+    "1",  # temp_qc
+    "1",  # dew_point_qc
+    "1",  # sea_level_pressure_qc
+)
+
+# One-row frame built once at import, with an explicit all-string schema
+_TEMPLATE_DF = pl.DataFrame(
+    [[value] for value in _DEFAULTS],
+    schema=dict.fromkeys(_COLS, pl.Utf8),
+    orient="col",
+)
+
+
+@cache
+def _create_test_dataframe(**overrides: str) -> pl.DataFrame:
+    """Helper function to create a test DataFrame with weather data.
+
+    Results are cached per set of overrides; callers must not modify the returned frame in place.
+    """
+    unknown = overrides.keys() - _TEMPLATE_DF.schema.keys()
+    assert not unknown, f"Unknown raw columns: {sorted(unknown)}"
+    return _TEMPLATE_DF.with_columns(
+        pl.lit(value, dtype=pl.Utf8).alias(name) for name, value in overrides.items()
     )
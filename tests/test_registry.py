@@ -35,6 +35,16 @@ class TestSanitizeName:
         """Test lowercase is converted to uppercase."""
         assert _sanitize_name("new york") == "NEW_YORK"
 
+    def test_repeated_and_edge_separators(self):
+        """Test separator runs collapse and edge separators are dropped."""
+        assert _sanitize_name("  (NEW)--YORK__CITY.  ") == "NEW_YORK_CITY"
+        assert _sanitize_name("...") == "UNKNOWN"
+
+    def test_non_ascii_name(self):
+        """Test non-ASCII characters are treated as separators after upper-casing."""
+        assert _sanitize_name("SÃO PAULO") == "S_O_PAULO"
+        assert _sanitize_name("straße") == "STRASSE"
+
 
 class TestStationNamespace:
     """Tests for the _StationNamespace class."""
@@ -63,6 +73,22 @@ class TestStationNamespace:
         assert "STATION_B" in names
         assert "GROUP_X" in names
 
+    def test_dir_is_sorted_and_cached(self):
+        """Test dir() is sorted and computed only once."""
+        ns = _StationNamespace(stations={"B": "2", "A": "1"}, children={"C": _StationNamespace()})
+        assert dir(ns) == ["A", "B", "C"]
+        cached = ns._dir_cache
+        assert ns.__dir__() == ns.__dir__() == ["A", "B", "C"]
+        assert ns._ipython_key_completions_() == ["A", "B", "C"]
+        assert ns._dir_cache is cached
+
+    def test_dir_result_is_a_copy(self):
+        """Test mutating the list returned by dir() leaves later calls unchanged."""
+        ns = _StationNamespace(stations={"A": "1"})
+        ns.__dir__().append("B")
+        ns._ipython_key_completions_().clear()
+        assert dir(ns) == ["A"]
+
     def test_attribute_error_for_unknown(self):
         """Test AttributeError for unknown station."""
         ns = _StationNamespace(stations={"KNOWN": "123"})
@@ -74,6 +100,14 @@ class TestStationNamespace:
         ns = _StationNamespace(stations={"TEST_STATION": "123456-99999"})
         assert ns.test_station == "123456-99999"
 
+    def test_case_insensitive_index_built_lazily(self):
+        """Test the case-insensitive index is only built on the first case-insensitive lookup."""
+        ns = _StationNamespace(stations={"TEST_STATION": "123456-99999"})
+        assert ns.TEST_STATION == "123456-99999"
+        assert ns._ci_index is None
+        assert ns.Test_Station == "123456-99999"
+        assert ns._ci_index == {"TEST_STATION": "123456-99999"}
+
     def test_case_insensitive_child_access(self):
         """Test case-insensitive access for child namespaces."""
         child = _StationNamespace(stations={"INNER": "111"})
@@ -92,6 +126,12 @@ class TestStationNamespace:
         # Access station with different case (no child has this name)
         assert ns.my_station == "123456-99999"
 
+    def test_case_insensitive_child_preferred_over_station(self):
+        """Test case-insensitive lookup checks children before stations."""
+        child = _StationNamespace(stations={"INNER": "111"})
+        ns = _StationNamespace(children={"SHARED": child}, stations={"Shared": "123456-99999"})
+        assert ns.shared is child
+
     def test_private_attribute_raises(self):
         """Test that accessing private attributes raises AttributeError."""
         ns = _StationNamespace(stations={"TEST": "123"})
@@ -129,6 +169,12 @@ class TestStationNamespace:
         ns = _StationNamespace()
         assert "empty" in repr(ns)
 
+    def test_no_instance_dict(self):
+        """Test namespaces use __slots__ rather than a per-instance __dict__."""
+        ns = _StationNamespace(stations={"A": "1"})
+        assert not hasattr(ns, "__dict__")
+        assert not hasattr(station, "__dict__")
+
     def test_ipython_key_completions(self):
         """Test IPython bracket completion support."""
         ns = _StationNamespace(stations={"A": "1", "B": "2"})
@@ -137,6 +183,31 @@ class TestStationNamespace:
         assert "B" in completions
 
 
+@pytest.fixture(scope="session")
+def loaded_station():
+    """Load the station registry once and return it."""
+    _ = wv.station.US.NY.JOHN_F_KENNEDY_INTERNATIONAL_AIRPORT
+    return wv.station
+
+
+@pytest.fixture(scope="module")
+def ny(loaded_station):
+    """Resolve the New York namespace once for all registry tests."""
+    return loaded_station.US.NY
+
+
+@pytest.fixture(scope="module")
+def jfk_id(ny):
+    """Resolve the JFK station ID once."""
+    return ny.JOHN_F_KENNEDY_INTERNATIONAL_AIRPORT
+
+
+@pytest.fixture(scope="module")
+def kennedy_results(loaded_station):
+    """Run the registry search for "kennedy" once."""
+    return loaded_station.search("kennedy")
+
+
 class TestStationRegistry:
     """Tests for the station registry singleton."""
 
@@ -153,76 +224,201 @@ class TestStationRegistry:
         fresh = _StationRegistry()
         assert "not loaded" in repr(fresh)
 
+    def test_search_without_network(self):
+        """Test search() substring matching and result order on a hand-built registry."""
+        from weathervault._registry import _StationRegistry
+
+        registry = _StationRegistry()
+        ny = _StationNamespace(stations={"KENNEDY_KENNEDY": "1", "LA_GUARDIA": "2"})
+        registry._children = {
+            "US": _StationNamespace(stations={"KENNEDY_POINT": "3"}, children={"NY": ny}),
+            "DE": _StationNamespace(stations={"BERLIN": "4", "NEDY": "5"}),
+        }
+        registry._loaded = True
+
+        results = registry.search("nedy")
+        assert list(results.items()) == [
+            ("US.KENNEDY_POINT", "3"),
+            ("US.NY.KENNEDY_KENNEDY", "1"),
+            ("DE.NEDY", "5"),
+        ]
+        assert registry.search("YLA") == {}  # Must not match across two names
+        assert registry.search("") == {
+            "US.KENNEDY_POINT": "3",
+            "US.NY.KENNEDY_KENNEDY": "1",
+            "US.NY.LA_GUARDIA": "2",
+            "DE.BERLIN": "4",
+            "DE.NEDY": "5",
+        }
+
+    def test_load_round_trips_through_cache_dir(self, tmp_path, monkeypatch):
+        """Test load(cache_dir=) saves the hierarchy and a later load reads it back."""
+        import datetime as dt
+
+        import polars as pl
+
+        from weathervault import _registry
+        from weathervault._registry import _StationRegistry
+
+        stations_df = pl.DataFrame(
+            {
+                "id": ["725030-14732", "103820-99999"],
+                "name": ["LA GUARDIA AIRPORT", "BERLIN TEGEL"],
+                "country_code": ["US", "DE"],
+                "state": ["NY", None],
+                "end_date": [dt.date(2025, 1, 1), dt.date(2020, 1, 1)],
+            }
+        )
+        monkeypatch.setattr(_registry, "_get_stations_df", lambda: stations_df)
+
+        first = _StationRegistry().load(cache_dir=tmp_path)
+        assert first.US.NY.LA_GUARDIA_AIRPORT == "725030-14732"
+        assert len(list(tmp_path.glob("station-registry-*.pickle.gz"))) == 1
+
+        def fail():
+            raise AssertionError("station metadata should not be needed")
+
+        monkeypatch.setattr(_registry, "_get_stations_df", fail)
+        second = _StationRegistry().load(cache_dir=tmp_path)
+        assert second.US.NY.LA_GUARDIA_AIRPORT == "725030-14732"
+        assert second.DE.BERLIN_TEGEL == "103820-99999"
+        assert second.search("tegel") == {"DE.BERLIN_TEGEL": "103820-99999"}
+
+    def test_load_saves_already_loaded_registry(self, tmp_path, monkeypatch):
+        """Test load(cache_dir=) writes the cache even if the hierarchy was built earlier."""
+        import datetime as dt
+
+        import polars as pl
+
+        from weathervault import _registry
+        from weathervault._registry import _StationRegistry
+
+        stations_df = pl.DataFrame(
+            {
+                "id": ["725030-14732"],
+                "name": ["LA GUARDIA AIRPORT"],
+                "country_code": ["US"],
+                "state": ["NY"],
+                "end_date": [dt.date(2025, 1, 1)],
+            }
+        )
+        monkeypatch.setattr(_registry, "_get_stations_df", lambda: stations_df)
+
+        registry = _StationRegistry()
+        assert registry.US.NY.LA_GUARDIA_AIRPORT == "725030-14732"
+        assert registry.load(cache_dir=tmp_path) is registry
+
+        cached = _registry._read_registry_cache(_registry._registry_cache_file(tmp_path))
+        assert cached is not None
+        assert cached["US"].NY.LA_GUARDIA_AIRPORT == "725030-14732"
+
+    @pytest.mark.parametrize("failing", ["pickle.dump", "os.replace"])
+    def test_temporary_file_removed_when_cache_write_fails(self, tmp_path, monkeypatch, failing):
+        """Test that the temporary file is deleted if the cache cannot be written."""
+        from weathervault import _registry
+        from weathervault._registry import _StationNamespace
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(f"weathervault._registry.{failing}", fail)
+        cache_file = _registry._registry_cache_file(tmp_path)
+
+        with pytest.raises(OSError, match="disk full"):
+            _registry._write_registry_cache(cache_file, {"US": _StationNamespace()})
+        assert list(tmp_path.iterdir()) == []
+
+    def test_build_groups_by_country_and_state(self, monkeypatch):
+        """Test the hierarchy nests US states, keeps the newest ID and survives name clashes."""
+        import datetime as dt
+
+        import polars as pl
+
+        from weathervault import _registry
+        from weathervault._registry import _StationRegistry
+
+        stations_df = pl.DataFrame(
+            {
+                "id": ["999999-14732", "725030-14732", "000001-99999", "103820-99999"],
+                "name": ["LA GUARDIA AIRPORT", "LA GUARDIA AIRPORT", "NY", "BERLIN TEGEL"],
+                "country_code": ["US", "US", "US", None],
+                "state": ["NY", "NY", "", "BE"],
+                "end_date": [dt.date(1972, 1, 1), dt.date(2025, 1, 1), None, None],
+            }
+        )
+        monkeypatch.setattr(_registry, "_get_stations_df", lambda: stations_df)
+
+        registry = _StationRegistry()
+        assert registry.US.NY.LA_GUARDIA_AIRPORT == "725030-14732"
+        # A state-less US station named like a state doesn't shadow that state's namespace
+        assert registry.US._stations == {"NY": "000001-99999"}
+        assert isinstance(registry.US.NY, _StationNamespace)
+        # Missing country codes fall back to "XX", and non-US states aren't nested
+        assert registry.XX.BERLIN_TEGEL == "103820-99999"
+
     @pytest.mark.network
-    def test_access_us_namespace(self):
+    def test_access_us_namespace(self, loaded_station):
         """Test accessing US namespace loads data."""
-        us = wv.station.US
+        us = loaded_station.US
         assert isinstance(us, _StationNamespace)
 
     @pytest.mark.network
-    def test_access_us_state(self):
+    def test_access_us_state(self, ny):
         """Test accessing a US state."""
-        ny = wv.station.US.NY
         assert isinstance(ny, _StationNamespace)
         # Should have stations
         assert len(dir(ny)) > 0
 
     @pytest.mark.network
-    def test_registry_dir_after_load(self):
+    def test_registry_dir_after_load(self, loaded_station):
         """Test dir() on registry after loading."""
-        # Access to trigger load
-        _ = wv.station.US
-        countries = dir(wv.station)
+        countries = dir(loaded_station)
         assert "US" in countries
         assert len(countries) > 10  # Should have many countries
 
     @pytest.mark.network
-    def test_registry_repr_after_load(self):
+    def test_registry_repr_after_load(self, loaded_station):
         """Test repr shows country count after loading."""
-        # Access to trigger load
-        _ = wv.station.US
-        repr_str = repr(wv.station)
+        repr_str = repr(loaded_station)
         assert "countries" in repr_str
         assert "not loaded" not in repr_str
 
     @pytest.mark.network
-    def test_get_known_station_id(self):
+    def test_non_us_country(self, loaded_station):
+        """Test accessing non-US countries."""
+        # Germany should have stations (ISO code DE, FIPS code GM)
+        de = loaded_station.DE  # Germany uses ISO code DE
+        assert hasattr(de, "__getattr__")  # Should be a country node
+
+
+@pytest.mark.network
+class TestStationLookups:
+    """Tests for resolving known stations from the loaded registry."""
+
+    def test_get_known_station_id(self, jfk_id):
         """Test getting a known station ID."""
         # JFK airport should be available
-        jfk_id = wv.station.US.NY.JOHN_F_KENNEDY_INTERNATIONAL_AIRPORT
         assert jfk_id == "744860-94789"
 
-    @pytest.mark.network
-    def test_search_functionality(self):
+    def test_search_functionality(self, kennedy_results, jfk_id):
         """Test the search method."""
-        results = wv.station.search("kennedy")
-        assert len(results) > 0
-        # Should find JFK
-        assert any("KENNEDY" in key for key in results)
+        assert len(kennedy_results) > 0
+        # Every match should contain the pattern, and JFK should be among them
+        assert all("KENNEDY" in key for key in kennedy_results)
+        assert jfk_id in kennedy_results.values()
 
-    @pytest.mark.network
-    def test_active_station_preferred(self):
+    def test_active_station_preferred(self, ny):
         """Test that active stations are preferred over historical ones."""
         # LA GUARDIA AIRPORT (725030-14732) should be preferred over
         # NEW YORK LAGUARDIA ARPT (999999-14732) which ended in 1972
-        lga_id = wv.station.US.NY.LA_GUARDIA_AIRPORT
-        assert lga_id == "725030-14732"
+        assert ny.LA_GUARDIA_AIRPORT == "725030-14732"
 
-    @pytest.mark.network
-    def test_non_us_country(self):
-        """Test accessing non-US countries."""
-        # Germany should have stations (ISO code DE, FIPS code GM)
-        de = wv.station.DE  # Germany uses ISO code DE
-        assert hasattr(de, "__getattr__")  # Should be a country node
-
-    @pytest.mark.network
-    def test_use_with_get_weather_data(self):
+    def test_use_with_get_weather_data(self, jfk_id):
         """Test that station IDs work with get_weather_data."""
-        station_id = wv.station.US.NY.JOHN_F_KENNEDY_INTERNATIONAL_AIRPORT
         # Just verify it's a valid string format
-        assert isinstance(station_id, str)
-        assert "-" in station_id
-        parts = station_id.split("-")
+        assert isinstance(jfk_id, str)
+        assert "-" in jfk_id
+        parts = jfk_id.split("-")
         assert len(parts) == 2
         assert parts[0].isdigit()
         assert parts[1].isdigit()
@@ -35,8 +35,7 @@ class TestGetCountries:
         """Test that results are sorted by country name."""
         result = get_countries()
 
-        countries = result["country"].to_list()
-        assert countries == sorted(countries)
+        assert result["country"].is_sorted()
 
     def test_contains_known_countries(self):
         """Test that known countries are present."""
@@ -47,6 +46,10 @@ class TestGetCountries:
         assert "Canada" in countries
         assert "United Kingdom" in countries
 
+    def test_result_is_cached(self):
+        """Test that repeated calls return the same cached DataFrame."""
+        assert get_countries() is get_countries()
+
 
 class TestGetStationMetadata:
     """Tests for get_station_metadata function.
@@ -155,7 +158,8 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         # All results should be in California
-        assert all(state == "CA" for state in result["state"].to_list() if state)
+        states = result["state"].drop_nulls()
+        assert states.filter(states != "").eq("CA").all()
 
     @pytest.mark.network
     def test_search_by_country(self):
@@ -164,7 +168,8 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         if result.height > 0:
-            assert all(code == "CA" for code in result["country_code"].to_list() if code)
+            codes = result["country_code"].drop_nulls()
+            assert codes.filter(codes != "").eq("CA").all()
 
     @pytest.mark.network
     def test_search_by_country_code(self):
@@ -173,7 +178,7 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         if result.height > 0:
-            assert all(code == "UK" for code in result["country_code"].to_list())
+            assert result["country_code"].eq_missing("UK").all()
 
     @pytest.mark.network
     def test_search_by_lat_range(self):
@@ -182,8 +187,7 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         if result.height > 0:
-            lats = result["lat"].to_list()
-            assert all(40.0 <= lat <= 41.0 for lat in lats if lat is not None)
+            assert result["lat"].drop_nulls().is_between(40.0, 41.0).all()
 
     @pytest.mark.network
     def test_search_by_lon_range(self):
@@ -192,8 +196,7 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         if result.height > 0:
-            lons = result["lon"].to_list()
-            assert all(-75.0 <= lon <= -74.0 for lon in lons if lon is not None)
+            assert result["lon"].drop_nulls().is_between(-75.0, -74.0).all()
 
     @pytest.mark.network
     def test_search_by_name(self):
@@ -202,8 +205,9 @@ class TestSearchStations:
 
         assert isinstance(result, pl.DataFrame)
         if result.height > 0:
-            names = result["name"].to_list()
-            assert all("airport" in name.lower() for name in names if name)
+            names = result["name"].drop_nulls()
+            names = names.filter(names != "").str.to_lowercase()
+            assert names.str.contains("airport", literal=True).all()
 
     @pytest.mark.network
     def test_combined_search(self):
@@ -224,8 +228,7 @@ class TestSearchStations:
             # All stations should have end_date >= last year
             current_year = date.today().year
             cutoff = date(current_year - 1, 1, 1)
-            end_dates = result["end_date"].to_list()
-            assert all(d >= cutoff for d in end_dates if d is not None)
+            assert (result["end_date"].drop_nulls() >= cutoff).all()
 
 
 class TestGetInventory:
@@ -271,25 +274,23 @@ class TestGetInventory:
         """Test that total column is sum of monthly values."""
         result = get_inventory()
 
-        # Check first row
-        row = result.row(0, named=True)
-        expected_total = sum(
-            [
-                row["jan"],
-                row["feb"],
-                row["mar"],
-                row["apr"],
-                row["may"],
-                row["jun"],
-                row["jul"],
-                row["aug"],
-                row["sep"],
-                row["oct"],
-                row["nov"],
-                row["dec"],
-            ]
-        )
-        assert row["total"] == expected_total
+        # Check every row at once
+        months = [
+            "jan",
+            "feb",
+            "mar",
+            "apr",
+            "may",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "oct",
+            "nov",
+            "dec",
+        ]
+        sums = result.select(pl.sum_horizontal(months)).to_series()
+        assert (result["total"] == sums).all()
 
 
 class TestGetYearsForStation:
@@ -308,8 +309,7 @@ class TestGetYearsForStation:
         """Test that years are sorted."""
         result = get_years_for_station("725030-14732")
 
-        if result:
-            assert result == sorted(result)
+        assert pl.Series(result, dtype=pl.Int64).is_sorted()
 
     @pytest.mark.network
     def test_invalid_station(self):
@@ -322,15 +322,32 @@ class TestGetYearsForStation:
     def test_known_station_has_recent_years(self):
         """Test that a known active station has recent years."""
         result = get_years_for_station("725030-14732")
-        # LaGuardia should have data at least from 2020 onwards
-        assert any(year >= 2020 for year in result)
+        # LaGuardia should have data at least from 2020 onwards (years are sorted)
+        assert result[-1] >= 2020
 
     @pytest.mark.network
     def test_known_station_has_historical_years(self):
         """Test that a known station has historical data."""
         result = get_years_for_station("725030-14732")
-        # LaGuardia has been recording for decades
-        assert any(year < 2000 for year in result)
+        # LaGuardia has been recording for decades (years are sorted)
+        assert result[0] < 2000
+
+    def test_follows_refreshed_inventory(self, monkeypatch):
+        """Test that lookups are answered from the inventory currently in use."""
+        from weathervault import stations
+
+        inventory = pl.DataFrame({"id": ["A", "B", "A"], "year": [2021, 2020, 2019]})
+        monkeypatch.setattr(stations, "get_inventory", lambda: inventory)
+
+        assert get_years_for_station("A") == [2019, 2021]
+        assert get_years_for_station("C") == []
+
+        # A new inventory frame (e.g. after `force_refresh=True`) replaces the cached index
+        refreshed = pl.DataFrame({"id": ["A", "C"], "year": [2022, 2023]})
+        monkeypatch.setattr(stations, "get_inventory", lambda: refreshed)
+
+        assert get_years_for_station("A") == [2022]
+        assert get_years_for_station("C") == [2023]
 
 
 class TestCountryCodeMapping:
@@ -355,7 +372,8 @@ class TestCountryCodeMapping:
         result = search_stations(country="Australia")
         if result.height > 0:
             # Should find stations with ISO code 'AU' (not FIPS 'AS')
-            assert all(code == "AU" for code in result["country_code"].to_list() if code)
+            codes = result["country_code"].drop_nulls()
+            assert codes.filter(codes != "").eq("AU").all()
 
 
 class TestSearchStationsAdvanced:
@@ -374,13 +392,9 @@ class TestSearchStationsAdvanced:
         # Around New York City
         result = search_stations(lat_range=(40.5, 41.0), lon_range=(-74.5, -73.5))
         assert isinstance(result, pl.DataFrame)
-        if result.height > 0:
-            # Verify all results are in bounds
-            for row in result.iter_rows(named=True):
-                if row["lat"] is not None:
-                    assert 40.5 <= row["lat"] <= 41.0
-                if row["lon"] is not None:
-                    assert -74.5 <= row["lon"] <= -73.5
+        # Verify all results are in bounds
+        assert result["lat"].drop_nulls().is_between(40.5, 41.0).all()
+        assert result["lon"].drop_nulls().is_between(-74.5, -73.5).all()
 
     @pytest.mark.network
     def test_name_search_case_insensitive(self):
@@ -391,18 +405,30 @@ class TestSearchStationsAdvanced:
         assert upper_result.height > 0
         assert lower_result.height > 0
 
+    def test_name_search_is_literal(self, monkeypatch):
+        """Test that name and country searches match substrings literally, not as regexes."""
+        from weathervault import stations
+
+        metadata = pl.DataFrame(
+            {
+                "name": ["ST. MARY (AK)", "STXMARY", "BRISTOL"],
+                "country": ["United States", "United States", "United Kingdom"],
+            }
+        )
+        monkeypatch.setattr(stations, "get_station_metadata", lambda: metadata)
+
+        assert search_stations(name="st. mary (")["name"].to_list() == ["ST. MARY (AK)"]
+        assert search_stations(country="united k")["name"].to_list() == ["BRISTOL"]
+
     @pytest.mark.network
     def test_state_combined_with_lat_range(self):
         """Test combining state with latitude range."""
         result = search_stations(state="CA", lat_range=(35.0, 40.0))
         assert isinstance(result, pl.DataFrame)
-        if result.height > 0:
-            # All should be in California and within lat range
-            for row in result.iter_rows(named=True):
-                if row["state"]:
-                    assert row["state"] == "CA"
-                if row["lat"] is not None:
-                    assert 35.0 <= row["lat"] <= 40.0
+        # All should be in California and within lat range
+        states = result["state"].drop_nulls()
+        assert states.filter(states != "").eq("CA").all()
+        assert result["lat"].drop_nulls().is_between(35.0, 40.0).all()
 
 
 class TestStationMetadataDetails:
@@ -413,10 +439,13 @@ class TestStationMetadataDetails:
         """Test that timezone is populated for stations with coordinates."""
         result = get_station_metadata()
         # Stations with lat/lon should have timezone
-        with_coords = result.filter(pl.col("lat").is_not_null() & pl.col("lon").is_not_null())
-        if with_coords.height > 0:
+        has_coords = pl.col("lat").is_not_null() & pl.col("lon").is_not_null()
+        with_coords, tz_populated = result.select(
+            has_coords.sum().alias("with_coords"),
+            (has_coords & pl.col("tz_name").is_not_null()).sum().alias("tz_populated"),
+        ).row(0)
+        if with_coords > 0:
             # At least some should have timezone
-            tz_populated = with_coords.filter(pl.col("tz_name").is_not_null()).height
             assert tz_populated > 0
 
     @pytest.mark.network
@@ -424,21 +453,19 @@ class TestStationMetadataDetails:
         """Test that begin_date and end_date are valid dates."""
         result = get_station_metadata()
         # Check that dates are not null for at least some stations
-        with_dates = result.filter(pl.col("begin_date").is_not_null())
-        assert with_dates.height > 0
+        assert result["begin_date"].null_count() < result.height
 
     @pytest.mark.network
     def test_elevation_reasonable(self):
         """Test that elevations are in reasonable range."""
         result = get_station_metadata()
-        elevations = result.filter(pl.col("elev").is_not_null())["elev"].to_list()
+        elevations = result["elev"].drop_nulls()
         # Elevations should be between -500m (Dead Sea area) and 10000m (extreme mountains)
         # Missing values (-999.0, -999.9) should already be converted to null
-        out_of_range = [elev for elev in elevations if not (-500 < elev < 10000)]
-        assert len(out_of_range) == 0, (
-            f"Found {len(out_of_range)} elevations out of range [-500, 10000]: "
-            f"min={min(out_of_range) if out_of_range else 'N/A'}, "
-            f"max={max(out_of_range) if out_of_range else 'N/A'}"
+        out_of_range = elevations.filter(~elevations.is_between(-500, 10000, closed="none"))
+        assert out_of_range.is_empty(), (
+            f"Found {out_of_range.len()} elevations out of range [-500, 10000]: "
+            f"min={out_of_range.min()}, max={out_of_range.max()}"
         )
 
 
@@ -463,24 +490,24 @@ class TestInventoryDetails:
             "nov",
             "dec",
         ]
-        for month in months:
-            assert all(v >= 0 for v in result[month].to_list())
+        # Smallest count across all month columns, computed in one pass
+        assert result.select(pl.min_horizontal(months).min()).item() >= 0
 
     @pytest.mark.network
     def test_years_reasonable(self):
         """Test that years in inventory are reasonable."""
         result = get_inventory()
-        years = result["year"].unique().to_list()
+        years = result["year"]
         # Should have years from historical to recent
-        assert min(years) < 2000  # Has historical data
-        assert max(years) >= 2020  # Has recent data
+        assert years.min() < 2000  # Has historical data
+        assert years.max() >= 2020  # Has recent data
 
     @pytest.mark.network
     def test_inventory_matches_station_format(self):
         """Test that inventory IDs match station ID format."""
         result = get_inventory()
         # All IDs should contain hyphen
-        assert all("-" in sid for sid in result["id"].to_list())
+        assert result["id"].str.contains("-", literal=True).all()
 
 
 class TestCountryShorthand:
@@ -544,6 +571,17 @@ class TestCountryShorthand:
         assert "FR" in codes
         assert len(codes) > 200  # Should have many country codes
 
+    def test_dir_result_is_a_copy(self):
+        """Test that mutating the list returned by dir() leaves later calls unchanged."""
+        wv.country.__dir__().clear()
+        assert "US" in dir(wv.country)
+
+    def test_follows_changes_to_table(self, monkeypatch):
+        """Test that a code added to wv.ISO_COUNTRY_NAMES is accepted and listed."""
+        monkeypatch.setitem(wv.ISO_COUNTRY_NAMES, "XK", "Kosovo")
+        assert wv.country.xk == "XK"
+        assert "XK" in dir(wv.country)
+
     def test_repr(self):
         """Test string representation of country object."""
         repr_str = repr(wv.country)
@@ -621,6 +659,17 @@ class TestStateShorthand:
         assert "FL" in codes
         assert len(codes) == 56  # 50 states + DC + 5 territories
 
+    def test_dir_result_is_a_copy(self):
+        """Test that mutating the list returned by dir() leaves later calls unchanged."""
+        wv.state.__dir__().clear()
+        assert "CA" in dir(wv.state)
+
+    def test_follows_changes_to_table(self, monkeypatch):
+        """Test that a code added to wv.US_STATE_NAMES is accepted and listed."""
+        monkeypatch.setitem(wv.US_STATE_NAMES, "ZZ", "Example")
+        assert wv.state.zz == "ZZ"
+        assert "ZZ" in dir(wv.state)
+
     def test_repr(self):
         """Test string representation of state object."""
         repr_str = repr(wv.state)
@@ -1,10 +1,129 @@
 """Tests for the weather module."""
 
+import gzip
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+
+import httpx
 import polars as pl
 import pytest
+from polars.testing import assert_series_equal
 
 from weathervault.weather import get_weather_data
 
+# Reasonable (lower, upper, closed) bounds for the LaGuardia weather columns
+_VALUE_RANGES = {
+    # New York temps should be roughly -30 to 45 Celsius
+    "temp": (-40, 50, "none"),
+    # RH should be between 0 and 100 (with small tolerance for calculation quirks)
+    "rh": (-5, 110, "none"),
+    # Wind direction should be 1-360 degrees
+    "wd": (0, 360, "both"),
+    "ws": (0, float("inf"), "both"),
+    "visibility": (0, float("inf"), "both"),
+    # Sea level pressure typically 870-1084 hPa
+    "atmos_pres": (800, 1100, "none"),
+}
+
+
+# Mandatory section of a LaGuardia ISD record; characters 15-27 hold the UTC timestamp and
+# characters 87-92 the temperature in tenths of a degree Celsius
+_LGA_ISD_LINE = (
+    "0105725030147322023071514004+40750-073900FM-15+0003KLGA "
+    "V0202701N005112200019N0160931N9+02611+01721101321"
+)
+
+
+def _isd_line(time: datetime, temp: str = "+0261") -> str:
+    """A LaGuardia ISD record observed at `time` (UTC)."""
+    return (
+        _LGA_ISD_LINE[:15] + f"{time:%Y%m%d%H%M}" + _LGA_ISD_LINE[27:87] + temp + _LGA_ISD_LINE[92:]
+    )
+
+
+def _canned_isd(year: int) -> bytes:
+    """Gzipped LaGuardia records at 00:00 and 12:00 UTC on the 1st and 15th of each month."""
+    lines = [
+        _isd_line(datetime(year, month, day, hour))
+        for month in range(1, 13)
+        for day in (1, 15)
+        for hour in (0, 12)
+    ]
+    return gzip.compress("\n".join(lines).encode())
+
+
+# Canned station-year files served by the mocked `_fetch_year_data`, built once at import
+_CANNED_ISD = {year: _canned_isd(year) for year in range(2021, 2025)}
+
+
+@pytest.fixture(scope="module")
+def mock_station_df():
+    """Create a mock station metadata DataFrame, shared (read-only) by the module's tests."""
+    return pl.DataFrame(
+        {
+            "id": ["725030-14732"],
+            "tz_name": ["America/New_York"],
+            "name": ["LA GUARDIA AIRPORT"],
+            "country": ["United States"],
+            "state": ["NY"],
+            "icao": ["KLGA"],
+            "lat": [40.779],
+            "lon": [-73.88],
+            "elev": [3.4],
+        }
+    )
+
+
+@pytest.fixture
+def mocked_station(monkeypatch, mock_station_df):
+    """Stub out every network call: station 725030-14732 with data for 2020-2023.
+
+    Only LaGuardia is listed in the station metadata, so unknown IDs fail without network.
+    Returns a recorder whose `fetched_years` lists each year passed to `_fetch_year_data`
+    (which serves the bytes in `files`, empty by default) and whose `set_available()`
+    replaces the available years.
+    """
+
+    def set_available(years):
+        monkeypatch.setattr("weathervault.weather.get_years_for_station", lambda station_id: years)
+
+    def fetch(station_id, year, cache_path=None):
+        env.fetched_years.append(year)
+        return env.files.get(year)
+
+    env = SimpleNamespace(fetched_years=[], files={}, set_available=set_available)
+    set_available([2020, 2021, 2022, 2023])
+    monkeypatch.setattr(
+        "weathervault.weather.get_station_metadata",
+        lambda **kwargs: mock_station_df,
+    )
+    monkeypatch.setattr("weathervault.weather._fetch_year_data", fetch)
+    return env
+
+
+@pytest.fixture
+def canned_lga(mocked_station):
+    """Serve canned LaGuardia files for 2021-2024 in place of NCEI downloads."""
+    mocked_station.files.update(_CANNED_ISD)
+    mocked_station.set_available(list(_CANNED_ISD))
+
+
+@pytest.fixture(scope="module")
+def lga_2023_in_range(lga_2023) -> dict[str, bool]:
+    """Whether each column in `_VALUE_RANGES` is within bounds, checked in one query."""
+    return (
+        lga_2023.lazy()
+        .select(
+            pl.col(column).is_between(lower, upper, closed=closed).all()
+            for column, (lower, upper, closed) in _VALUE_RANGES.items()
+        )
+        .collect()
+        .row(0, named=True)
+    )
+
 
 class TestGetWeatherData:
     """Tests for get_weather_data function.
@@ -13,18 +132,18 @@ class TestGetWeatherData:
     """
 
     @pytest.mark.network
-    def test_returns_dataframe(self):
+    def test_returns_dataframe(self, lga_2023):
         """Test that get_weather_data returns a DataFrame."""
         # Use LaGuardia Airport and a recent year
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
 
         assert isinstance(result, pl.DataFrame)
         assert result.height > 0
 
     @pytest.mark.network
-    def test_has_expected_columns(self):
+    def test_has_expected_columns(self, lga_2023):
         """Test that result has expected columns."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
 
         expected_columns = [
             "id",
@@ -42,175 +161,148 @@ class TestGetWeatherData:
             assert col in result.columns
 
     @pytest.mark.network
-    def test_data_sorted_by_time(self):
+    def test_data_sorted_by_time(self, lga_2023):
         """Test that data is sorted by time (using UTC for proper comparison)."""
-        result = get_weather_data("725030-14732", years=2023)
-
-        times = result["time"].to_list()
-        # Convert to UTC timestamps for proper sorting comparison
-        # (handles DST transitions correctly)
-        utc_times = [t.timestamp() for t in times]
-        is_sorted = all(utc_times[i] <= utc_times[i + 1] for i in range(len(utc_times) - 1))
-        if not is_sorted:
-            for i in range(len(utc_times) - 1):
-                if utc_times[i] > utc_times[i + 1]:
-                    pytest.fail(
-                        f"Data not sorted at index {i}: {times[i]} > {times[i + 1]} "
-                        f"(out of {len(times)} records)"
-                    )
-        assert is_sorted, f"Data is not sorted by time ({len(times)} records)"
+        result = lga_2023
+
+        # Time zone-aware datetimes are compared by their underlying UTC instant, so this
+        # handles DST transitions correctly
+        unsorted = (
+            result.with_row_index()
+            .filter(pl.col("time").diff() < pl.duration(seconds=0))
+            .get_column("index")
+        )
+        assert unsorted.is_empty(), (
+            f"Data not sorted at index {unsorted[0] - 1} (out of {result.height} records)"
+        )
 
     @pytest.mark.network
-    def test_fahrenheit_conversion(self):
+    def test_fahrenheit_conversion(self, lga_2023, lga_2023_f):
         """Test temperature in Fahrenheit."""
-        celsius_result = get_weather_data("725030-14732", years=2023, temp_unit="celsius")
-        fahrenheit_result = get_weather_data("725030-14732", years=2023, temp_unit="fahrenheit")
+        celsius_result = lga_2023
+        fahrenheit_result = lga_2023_f
 
-        # Get first non-null temperature
-        c_temp = celsius_result.filter(pl.col("temp").is_not_null())["temp"][0]
-        f_temp = fahrenheit_result.filter(pl.col("temp").is_not_null())["temp"][0]
-
-        # Verify Fahrenheit conversion: F = C * 9/5 + 32
-        expected_f = c_temp * 9 / 5 + 32
-        assert abs(f_temp - expected_f) < 0.2  # Allow small rounding difference
+        # Verify Fahrenheit conversion for every row: F = C * 9/5 + 32 (rounded to 0.1)
+        expected_f = celsius_result.select((pl.col("temp") * 9 / 5 + 32).round(1))
+        assert_series_equal(fahrenheit_result["temp"], expected_f["temp"])
 
     def test_invalid_temp_unit(self):
         """Test that invalid temp_unit raises error."""
         with pytest.raises(ValueError, match="temp_unit"):
             get_weather_data("725030-14732", years=2023, temp_unit="rankine")
 
-    @pytest.mark.network
-    def test_invalid_station(self):
+    def test_invalid_station(self, mocked_station):
         """Test that invalid station raises error."""
         with pytest.raises(ValueError, match="not found"):
             get_weather_data("000000-00000", years=2023)
 
     @pytest.mark.network
-    def test_multiple_years(self):
+    def test_multiple_years(self, lga_2022_2023):
         """Test fetching multiple years of data."""
-        result = get_weather_data("725030-14732", years=[2022, 2023])
+        result = lga_2022_2023
 
         assert isinstance(result, pl.DataFrame)
 
         # Should have data from both years
-        years_in_data = result["time"].dt.year().unique().to_list()
-        assert 2022 in years_in_data or 2023 in years_in_data
+        assert result.select(pl.col("time").dt.year().is_in([2022, 2023]).any()).item()
 
     @pytest.mark.network
-    def test_make_hourly(self):
+    def test_make_hourly(self, lga_2023_hourly):
         """Test hourly resampling."""
-        result = get_weather_data("725030-14732", years=2023, make_hourly=True)
+        result = lga_2023_hourly
 
         assert isinstance(result, pl.DataFrame)
 
         # All times should be at the start of an hour (minute = 0)
-        minutes = result["time"].dt.minute().unique().to_list()
-        assert minutes == [0]
+        assert result.select(pl.col("time").dt.minute().eq(0).all()).item()
 
     @pytest.mark.network
-    def test_station_id_in_result(self):
+    def test_station_id_in_result(self, lga_2023):
         """Test that station ID is included in results."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
 
-        assert all(sid == "725030-14732" for sid in result["id"].to_list())
+        assert result.select(pl.col("id").eq("725030-14732").all()).item(), (
+            f"Unexpected IDs: {result.filter(pl.col('id') != '725030-14732')['id'].unique()}"
+        )
 
     @pytest.mark.network
-    def test_reasonable_temperature_range(self):
-        """Test that temperatures are in reasonable range."""
-        result = get_weather_data("725030-14732", years=2023)
+    @pytest.mark.parametrize("column", list(_VALUE_RANGES))
+    def test_value_range(self, lga_2023, lga_2023_in_range, column):
+        """Test that non-null values in each column are in a reasonable range."""
+        # The offending values are only looked up to build the failure message
+        assert lga_2023_in_range[column], (
+            f"{column} outside {_VALUE_RANGES[column]}: "
+            f"min={lga_2023[column].min()}, max={lga_2023[column].max()}"
+        )
 
-        temps = result.filter(pl.col("temp").is_not_null())["temp"].to_list()
-        if temps:
-            # New York temps should be roughly -30 to 45 Celsius
-            assert all(-40 < t < 50 for t in temps)
 
-    @pytest.mark.network
-    def test_relative_humidity_range(self):
-        """Test that relative humidity is in 0-100 range."""
-        result = get_weather_data("725030-14732", years=2023)
+@pytest.mark.usefixtures("canned_lga")
+class TestGetWeatherDataMocked:
+    """Tests for get_weather_data against canned ISD files, without network access."""
 
-        rh_values = result.filter(pl.col("rh").is_not_null())["rh"].to_list()
-        if rh_values:
-            # RH should be between 0 and 100 (with small tolerance for calculation quirks)
-            assert all(-5 < rh < 110 for rh in rh_values)
+    def test_returns_processed_columns(self):
+        """Test that canned records are parsed into the processed columns."""
+        result = get_weather_data("725030-14732", years=2023, convert_to_local=False)
 
-    @pytest.mark.network
-    def test_wind_direction_range(self):
-        """Test that wind direction is in valid range."""
-        result = get_weather_data("725030-14732", years=2023)
+        assert result.columns[:3] == ["id", "time", "temp"]
+        assert result.height == 48
+        assert result.select(pl.col("id").eq("725030-14732").all()).item()
+        assert result.select(pl.col("temp").eq(26.1).all()).item()
 
-        wd_values = result.filter(pl.col("wd").is_not_null())["wd"].to_list()
-        if wd_values:
-            # Wind direction should be 1-360 degrees
-            assert all(0 <= wd <= 360 for wd in wd_values)
+    def test_utc_keeps_requested_year(self):
+        """Test that UTC results hold exactly the requested year, sorted by time."""
+        result = get_weather_data("725030-14732", years=2023, convert_to_local=False)
 
-    @pytest.mark.network
-    def test_wind_speed_non_negative(self):
-        """Test that wind speed values are non-negative."""
+        assert result["time"].is_sorted()
+        assert result["time"].min() == datetime(2023, 1, 1, tzinfo=result["time"].min().tzinfo)
+        assert result.select(pl.col("time").dt.year().eq(2023).all()).item()
+
+    def test_local_time_uses_buffer_year(self):
+        """Test that local results are trimmed to the requested year after conversion."""
         result = get_weather_data("725030-14732", years=2023)
 
-        ws_values = result.filter(pl.col("ws").is_not_null())["ws"].to_list()
-        if ws_values:
-            assert all(ws >= 0 for ws in ws_values)
+        assert result.select(pl.col("time").dt.year().eq(2023).all()).item()
+        # 2024-01-01 00:00 UTC falls on New Year's Eve in New York; 2023-01-01 00:00 UTC doesn't
+        assert result["time"].max().replace(tzinfo=None) == datetime(2023, 12, 31, 19)
+        assert result.height == 48
 
-    @pytest.mark.network
-    def test_visibility_non_negative(self):
-        """Test that visibility values are non-negative."""
-        result = get_weather_data("725030-14732", years=2023)
+    def test_fahrenheit_matches_celsius(self):
+        """Test that Fahrenheit output is the converted Celsius output."""
+        celsius = get_weather_data("725030-14732", years=2023)
+        fahrenheit = get_weather_data("725030-14732", years=2023, temp_unit="f")
 
-        vis_values = result.filter(pl.col("visibility").is_not_null())["visibility"].to_list()
-        if vis_values:
-            assert all(v >= 0 for v in vis_values)
+        assert_series_equal(fahrenheit["temp"], (celsius["temp"] * 9 / 5 + 32).round(1))
 
-    @pytest.mark.network
-    def test_atmospheric_pressure_reasonable(self):
-        """Test that atmospheric pressure is in reasonable range."""
-        result = get_weather_data("725030-14732", years=2023)
+    def test_multiple_years(self):
+        """Test that each requested year is returned in full."""
+        result = get_weather_data("725030-14732", years=[2022, 2023], convert_to_local=False)
 
-        pres_values = result.filter(pl.col("atmos_pres").is_not_null())["atmos_pres"].to_list()
-        if pres_values:
-            # Sea level pressure typically 870-1084 hPa
-            assert all(800 < p < 1100 for p in pres_values)
+        counts = result.group_by(pl.col("time").dt.year()).len().sort("time")
+        assert counts.rows() == [(2022, 48), (2023, 48)]
 
 
 class TestWeatherDataTypes:
     """Tests for weather data column types."""
 
     @pytest.mark.network
-    def test_time_is_datetime(self):
-        """Test that time column is datetime type."""
-        result = get_weather_data("725030-14732", years=2023)
-        assert result.schema["time"] == pl.Datetime
-
-    @pytest.mark.network
-    def test_temp_is_float(self):
-        """Test that temperature is float type."""
-        result = get_weather_data("725030-14732", years=2023)
-        assert result.schema["temp"] == pl.Float64
-
-    @pytest.mark.network
-    def test_wind_direction_is_int(self):
-        """Test that wind direction is integer type."""
-        result = get_weather_data("725030-14732", years=2023)
-        assert result.schema["wd"] == pl.Int32
-
-    @pytest.mark.network
-    def test_id_is_string(self):
-        """Test that id column is string type."""
-        result = get_weather_data("725030-14732", years=2023)
-        assert result.schema["id"] == pl.Utf8
+    @pytest.mark.parametrize(
+        ("column", "dtype"),
+        [("time", pl.Datetime), ("temp", pl.Float64), ("wd", pl.Int32), ("id", pl.Utf8)],
+    )
+    def test_column_dtype(self, lga_2023, column, dtype):
+        """Test that each column has the expected type."""
+        assert lga_2023.schema[column] == dtype
 
 
 class TestYearHandling:
     """Tests for year parameter handling."""
 
     @pytest.mark.network
-    def test_year_as_int(self):
+    def test_year_as_int(self, lga_2023):
         """Test passing a single year as integer."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
         assert isinstance(result, pl.DataFrame)
-        years_in_data = result["time"].dt.year().unique().to_list()
-        assert 2023 in years_in_data
+        assert result.select(pl.col("time").dt.year().eq(2023).any()).item()
 
     @pytest.mark.network
     def test_year_as_list(self):
@@ -223,113 +315,165 @@ class TestTemperatureUnit:
     """Tests for temperature unit conversion."""
 
     @pytest.mark.network
-    def test_celsius_default(self):
+    def test_celsius_default(self, lga_2023):
         """Test that Celsius is the default temperature unit."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
         # Should have reasonable Celsius values
-        temps = result.filter(pl.col("temp").is_not_null())["temp"].to_list()
-        if temps:
+        lo, hi = result.select(pl.col("temp").min(), pl.col("temp").max()).row(0)
+        if lo is not None:
             # New York Celsius temps should be roughly -30 to 45
-            assert all(-40 < t < 50 for t in temps)
+            assert lo > -40 and hi < 50
 
     @pytest.mark.network
-    def test_fahrenheit_values_higher(self):
+    def test_fahrenheit_values_higher(self, lga_2023, lga_2023_f):
         """Test that Fahrenheit values are higher than Celsius (mostly)."""
-        c_result = get_weather_data("725030-14732", years=2023, temp_unit="celsius")
-        f_result = get_weather_data("725030-14732", years=2023, temp_unit="fahrenheit")
+        c_result = lga_2023
+        f_result = lga_2023_f
 
-        c_mean = c_result.filter(pl.col("temp").is_not_null())["temp"].mean()
-        f_mean = f_result.filter(pl.col("temp").is_not_null())["temp"].mean()
+        # mean() skips nulls, so no filtering is needed
+        c_mean = c_result["temp"].mean()
+        f_mean = f_result["temp"].mean()
 
         # For positive Celsius temps, Fahrenheit should be higher
         if c_mean and c_mean > 0:
             assert f_mean > c_mean
+            # The conversion is linear, so it carries over to the means (allowing for the
+            # rounding of individual values)
+            assert abs(f_mean - (c_mean * 9 / 5 + 32)) < 0.2
 
     @pytest.mark.network
-    def test_kelvin_conversion(self):
+    def test_kelvin_conversion(self, lga_2023, lga_2023_k):
         """Test Kelvin temperature conversion."""
-        c_result = get_weather_data("725030-14732", years=2023, temp_unit="c")
-        k_result = get_weather_data("725030-14732", years=2023, temp_unit="k")
-
-        c_temp = c_result.filter(pl.col("temp").is_not_null())["temp"][0]
-        k_temp = k_result.filter(pl.col("temp").is_not_null())["temp"][0]
-
-        # Kelvin = Celsius + 273.15
-        expected_k = c_temp + 273.15
-        assert abs(k_temp - expected_k) < 0.1
-
-    @pytest.mark.network
-    def test_short_temp_unit_names(self):
-        """Test that short temperature unit names work."""
-        # Test 'c' for Celsius
-        c_result = get_weather_data("725030-14732", years=2023, temp_unit="c")
-        assert c_result.height > 0
-
-        # Test 'F' for Fahrenheit (uppercase)
-        f_result = get_weather_data("725030-14732", years=2023, temp_unit="F")
-        assert f_result.height > 0
-
-        # Test 'K' for Kelvin (uppercase)
-        k_result = get_weather_data("725030-14732", years=2023, temp_unit="K")
-        assert k_result.height > 0
+        c_result = lga_2023
+        k_result = lga_2023_k
+
+        # Kelvin = Celsius + 273.15 (rounded to 0.01), checked for every row
+        expected_k = c_result.select((pl.col("temp") + 273.15).round(2))
+        assert_series_equal(k_result["temp"], expected_k["temp"])
+
+    @pytest.mark.parametrize(
+        ("temp_unit", "expected"),
+        [
+            ("c", "celsius"),
+            ("C", "celsius"),
+            ("Celsius", "celsius"),
+            ("f", "fahrenheit"),
+            ("F", "fahrenheit"),
+            ("fahrenheit", "fahrenheit"),
+            ("k", "kelvin"),
+            ("K", "kelvin"),
+            (" kelvin ", "kelvin"),
+        ],
+    )
+    def test_short_temp_unit_names(self, canned_lga, temp_unit, expected):
+        """Test that short and mixed-case temperature unit names are accepted."""
+        from weathervault.weather import _normalize_temp_unit
+
+        # Every alias maps to one of the full unit names
+        assert _normalize_temp_unit(temp_unit) == expected
+
+        # ...and converts temperatures exactly as that full name does
+        result = get_weather_data("725030-14732", years=2023, temp_unit=temp_unit)
+        reference = get_weather_data("725030-14732", years=2023, temp_unit=expected)
+        assert_series_equal(result["temp"], reference["temp"])
 
 
 class TestLocalTimeConversion:
     """Tests for local time conversion."""
 
-    @pytest.mark.network
-    def test_convert_to_local_time(self):
-        """Test that local time conversion changes timestamps."""
-        utc_result = get_weather_data("725030-14732", years=2023, convert_to_local=False)
-        local_result = get_weather_data("725030-14732", years=2023, convert_to_local=True)
-
-        # Times should be different (LaGuardia is UTC-5 or UTC-4)
-        # Check that at least first timestamps differ
-        if utc_result.height > 0 and local_result.height > 0:
-            # The times might be the same if we compare naive datetimes
-            # but the data should have been processed
-            assert isinstance(local_result, pl.DataFrame)
+    def test_convert_to_local_time(self, canned_lga):
+        """Test that local times are the UTC observations converted to the station's zone."""
+        utc_result = get_weather_data("725030-14732", years=[2023, 2024], convert_to_local=False)
+        local_result = get_weather_data("725030-14732", years=2023)
+
+        # LaGuardia is UTC-5 (UTC-4 in summer), so 2023-01-01 00:00 UTC still falls in 2022
+        # locally while 2024-01-01 00:00 UTC is New Year's Eve
+        expected = utc_result["time"].dt.convert_time_zone("America/New_York")
+        assert_series_equal(local_result["time"], expected.filter(expected.dt.year() == 2023))
+
+    def test_dst_transitions(self, monkeypatch, canned_lga):
+        """Test that local times follow the DST changes around each observation."""
+        observed = [
+            datetime(2023, 3, 12, 6, 30),  # 01:30 EST, just before clocks spring forward
+            datetime(2023, 3, 12, 7, 30),  # 03:30 EDT, an hour later
+            datetime(2023, 11, 5, 5, 30),  # 01:30 EDT, before clocks fall back
+            datetime(2023, 11, 5, 6, 30),  # 01:30 EST, the repeated hour
+        ]
+        data = gzip.compress("\n".join(_isd_line(time) for time in observed).encode())
+        monkeypatch.setattr(
+            "weathervault.weather._fetch_year_data",
+            lambda station_id, year, cache_path=None: data if year == 2023 else None,
+        )
+
+        result = get_weather_data("725030-14732", years=2023)
+
+        local = result.select(
+            pl.col("time").dt.replace_time_zone(None),
+            (pl.col("time").dt.base_utc_offset() + pl.col("time").dt.dst_offset()).alias("offset"),
+        ).rows()
+        assert local == [
+            (datetime(2023, 3, 12, 1, 30), timedelta(hours=-5)),
+            (datetime(2023, 3, 12, 3, 30), timedelta(hours=-4)),
+            (datetime(2023, 11, 5, 1, 30), timedelta(hours=-4)),
+            (datetime(2023, 11, 5, 1, 30), timedelta(hours=-5)),
+        ]
 
     @pytest.mark.network
-    def test_no_conversion_default(self):
+    def test_no_conversion_default(self, lga_2023_utc):
         """Test that convert_to_local=False keeps UTC."""
-        result = get_weather_data("725030-14732", years=2023, convert_to_local=False)
+        result = lga_2023_utc
         assert isinstance(result, pl.DataFrame)
 
 
 class TestHourlyResampling:
     """Tests for hourly resampling."""
 
-    @pytest.mark.network
-    def test_hourly_reduces_rows(self):
-        """Test that hourly resampling reduces number of rows."""
-        raw = get_weather_data("725030-14732", years=2023, make_hourly=False)
-        hourly = get_weather_data("725030-14732", years=2023, make_hourly=True)
+    def test_hourly_fills_full_grid_keeping_first_observation(self, monkeypatch, canned_lga):
+        """Test that hourly resampling keeps the first observation of each hour."""
+        lines = [
+            _isd_line(datetime(2023, 1, 1, 0, 0), temp="+0100"),
+            _isd_line(datetime(2023, 1, 1, 0, 30), temp="+0200"),
+            _isd_line(datetime(2023, 1, 1, 1, 51), temp="+0300"),
+        ]
+        data = gzip.compress("\n".join(lines).encode())
+        monkeypatch.setattr(
+            "weathervault.weather._fetch_year_data",
+            lambda station_id, year, cache_path=None: data if year == 2023 else None,
+        )
+
+        raw = get_weather_data("725030-14732", years=2023, convert_to_local=False)
+        hourly = get_weather_data(
+            "725030-14732", years=2023, convert_to_local=False, make_hourly=True
+        )
 
-        # Hourly should have fewer or equal rows
-        assert hourly.height <= raw.height
+        # Every hour of the year is present, on the hour, but only two hold observations
+        assert raw.height == 3
+        assert hourly.height == 365 * 24
+        assert hourly.select(pl.col("time").dt.minute().eq(0).all()).item()
+        assert hourly["temp"].drop_nulls().to_list() == [10.0, 30.0]
 
     @pytest.mark.network
-    def test_hourly_time_aligned(self):
+    def test_hourly_time_aligned(self, lga_2023_hourly):
         """Test that hourly data has minute=0."""
-        result = get_weather_data("725030-14732", years=2023, make_hourly=True)
+        result = lga_2023_hourly
 
-        minutes = result["time"].dt.minute().to_list()
-        assert all(m == 0 for m in minutes)
+        assert result.select(pl.col("time").dt.minute().eq(0).all()).item(), (
+            f"Unaligned time: {result.filter(pl.col('time').dt.minute() != 0)['time'][0]}"
+        )
 
     @pytest.mark.network
-    def test_hourly_preserves_data_quality(self):
+    def test_hourly_preserves_data_quality(self, lga_2023_hourly):
         """Test that hourly resampling preserves reasonable values."""
-        result = get_weather_data("725030-14732", years=2023, make_hourly=True)
+        result = lga_2023_hourly
 
-        temps = result.filter(pl.col("temp").is_not_null())["temp"].to_list()
-        if temps:
+        lo, hi = result.select(pl.col("temp").min(), pl.col("temp").max()).row(0)
+        if lo is not None:
             # Values should still be in reasonable range
-            assert all(-40 < t < 50 for t in temps)
+            assert lo > -40 and hi < 50
 
-    def test_hourly_all_hours_regular_year(self):
+    def test_hourly_all_hours_regular_year(self, canned_lga):
         """Test that all hours are present for a regular (non-leap) year."""
-        # Use bundled data for 2023 (non-leap year)
+        # Canned data for 2023 (non-leap year) holds only a few records per month
         result = get_weather_data("725030-14732", years=2023, make_hourly=True)
 
         # Regular year has 365 days * 24 hours = 8760 hours
@@ -338,9 +482,9 @@ class TestHourlyResampling:
             f"Expected {expected_hours} hourly records for 2023, got {result.height}"
         )
 
-    def test_hourly_all_hours_leap_year(self):
+    def test_hourly_all_hours_leap_year(self, canned_lga):
         """Test that all hours are present for a leap year."""
-        # Use bundled data for 2024 (leap year)
+        # Canned data for 2024 (leap year)
         result = get_weather_data("725030-14732", years=2024, make_hourly=True)
 
         # Leap year has 366 days * 24 hours = 8784 hours
@@ -349,9 +493,9 @@ class TestHourlyResampling:
             f"Expected {expected_hours} hourly records for 2024, got {result.height}"
         )
 
-    def test_hourly_complete_december_coverage(self):
+    def test_hourly_complete_december_coverage(self, canned_lga):
         """Test that all hours of December (especially Dec 31) are present."""
-        # Use bundled data for 2024
+        # Canned data for 2024 has no records on Dec 31, so every hour there is filled in
         result = get_weather_data(
             "725030-14732", years=2024, make_hourly=True, time_as_columns=True
         )
@@ -375,9 +519,9 @@ class TestHourlyResampling:
         hours = dec_31["hour"].sort().to_list()
         assert hours == list(range(24)), f"December 31 missing some hours. Found: {hours}"
 
-    def test_hourly_complete_january_coverage(self):
+    def test_hourly_complete_january_coverage(self, canned_lga):
         """Test that all hours of January (including Jan 1) are present."""
-        # Use bundled data for 2024
+        # Canned data for 2024
         result = get_weather_data(
             "725030-14732", years=2024, make_hourly=True, time_as_columns=True
         )
@@ -399,9 +543,9 @@ class TestHourlyResampling:
         hours = jan_1["hour"].sort().to_list()
         assert hours == list(range(24)), f"January 1 missing some hours. Found: {hours}"
 
-    def test_hourly_multiple_years_correct_count(self):
+    def test_hourly_multiple_years_correct_count(self, canned_lga):
         """Test that multiple years have correct total hour count."""
-        # Use bundled data for 2023 (non-leap) and 2024 (leap)
+        # Canned data for 2023 (non-leap) and 2024 (leap)
         result = get_weather_data("725030-14732", years=[2023, 2024], make_hourly=True)
 
         # 2023: 365 days * 24 = 8760 hours
@@ -417,14 +561,14 @@ class TestStationIdFormats:
     """Tests for various station ID formats."""
 
     @pytest.mark.network
-    def test_hyphenated_id(self):
+    def test_hyphenated_id(self, lga_2023):
         """Test standard hyphenated station ID format."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
         assert isinstance(result, pl.DataFrame)
 
-    def test_invalid_id_format(self):
+    def test_invalid_id_format(self, mocked_station):
         """Test that completely invalid ID raises error."""
-        with pytest.raises(ValueError):
+        with pytest.raises(ValueError, match="not found"):
             get_weather_data("invalid", years=2023)
 
 
@@ -432,18 +576,18 @@ class TestDataConsistency:
     """Tests for data consistency across requests."""
 
     @pytest.mark.network
-    def test_same_data_multiple_calls(self):
+    def test_same_data_multiple_calls(self, lga_2023, isd_cache_dir):
         """Test that multiple calls return consistent data."""
-        result1 = get_weather_data("725030-14732", years=2023)
-        result2 = get_weather_data("725030-14732", years=2023)
+        result1 = lga_2023
+        # Re-reads the files the session fixture cached, so only parsing is repeated
+        result2 = get_weather_data("725030-14732", years=2023, cache_dir=isd_cache_dir)
 
-        assert result1.height == result2.height
-        assert result1.columns == result2.columns
+        assert result1.equals(result2)
 
     @pytest.mark.network
-    def test_column_order_consistent(self):
+    def test_column_order_consistent(self, lga_2023):
         """Test that column order is consistent."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
         expected_order = [
             "id",
             "time",
@@ -463,10 +607,11 @@ class TestStationInfo:
     """Tests for including station metadata in weather data."""
 
     @pytest.mark.network
-    def test_incl_stn_info_adds_columns(self):
-        """Test that incl_stn_info adds station metadata columns."""
-        result = get_weather_data("725030-14732", years=2023, incl_stn_info=True)
+    def test_station_info(self, lga_2023_stn_info):
+        """Test the station metadata columns added by incl_stn_info=True."""
+        result = lga_2023_stn_info
 
+        # Station metadata columns are appended after the weather columns
         expected_columns = [
             "id",
             "time",
@@ -488,46 +633,34 @@ class TestStationInfo:
         ]
         assert result.columns == expected_columns
 
+        # Coordinates are floats
+        assert result["lat"].dtype == pl.Float64
+        assert result["lon"].dtype == pl.Float64
+        assert result["elev"].dtype == pl.Float64
+
+        # All rows should have same station metadata
+        columns = ["name", "country", "icao", "lat", "lon"]
+        unique_counts = result.select(pl.col(columns).n_unique()).row(0, named=True)
+        assert unique_counts == dict.fromkeys(columns, 1)
+
+        # Values are populated and plausible for LaGuardia (NYC area, near sea level)
+        first_row = result.row(0, named=True)
+        assert first_row["name"] is not None
+        assert first_row["country"] is not None
+        assert first_row["icao"] == "KLGA"
+        assert 40 < first_row["lat"] < 41
+        assert -74 < first_row["lon"] < -73
+        assert -10 < first_row["elev"] < 100
+
     @pytest.mark.network
-    def test_incl_stn_info_default_false(self):
+    def test_incl_stn_info_default_false(self, lga_2023):
         """Test that station info is not included by default."""
-        result = get_weather_data("725030-14732", years=2023)
+        result = lga_2023
 
         station_columns = ["name", "country", "state", "icao", "lat", "lon", "elev"]
         for col in station_columns:
             assert col not in result.columns
 
-    @pytest.mark.network
-    def test_station_info_values_populated(self):
-        """Test that station metadata values are populated."""
-        result = get_weather_data("725030-14732", years=2023, incl_stn_info=True)
-
-        # Check first row has station info
-        first_row = result.head(1)
-        assert first_row["name"][0] is not None
-        assert first_row["country"][0] is not None
-        assert first_row["icao"][0] == "KLGA"
-        assert first_row["lat"][0] is not None
-        assert first_row["lon"][0] is not None
-
-    @pytest.mark.network
-    def test_station_info_consistent_across_rows(self):
-        """Test that station metadata is consistent across all rows."""
-        result = get_weather_data("725030-14732", years=2023, incl_stn_info=True)
-
-        # All rows should have same station metadata
-        unique_names = result["name"].n_unique()
-        unique_countries = result["country"].n_unique()
-        unique_icao = result["icao"].n_unique()
-        unique_lat = result["lat"].n_unique()
-        unique_lon = result["lon"].n_unique()
-
-        assert unique_names == 1
-        assert unique_countries == 1
-        assert unique_icao == 1
-        assert unique_lat == 1
-        assert unique_lon == 1
-
     @pytest.mark.network
     def test_station_info_with_hourly(self):
         """Test that station info works with hourly resampling."""
@@ -540,30 +673,7 @@ class TestStationInfo:
 
         # Metadata should be consistent
         assert result["name"].n_unique() == 1
-        assert result["icao"][0] == "KLGA"
-
-    @pytest.mark.network
-    def test_station_info_lat_lon_types(self):
-        """Test that lat/lon are float types."""
-        result = get_weather_data("725030-14732", years=2023, incl_stn_info=True)
-
-        assert result["lat"].dtype == pl.Float64
-        assert result["lon"].dtype == pl.Float64
-        assert result["elev"].dtype == pl.Float64
-
-    @pytest.mark.network
-    def test_station_info_reasonable_coordinates(self):
-        """Test that coordinates are in reasonable ranges."""
-        result = get_weather_data("725030-14732", years=2023, incl_stn_info=True)
-
-        lat = result["lat"][0]
-        lon = result["lon"][0]
-        elev = result["elev"][0]
-
-        # LaGuardia is in NYC area
-        assert 40 < lat < 41
-        assert -74 < lon < -73
-        assert -10 < elev < 100  # Near sea level
+        assert result.item(0, "icao") == "KLGA"
 
 
 class TestYearAvailabilityWarnings:
@@ -597,60 +707,37 @@ class TestYearAvailabilityWarnings:
         assert "Available years" in error_msg
 
     @pytest.mark.network
-    def test_partial_data_warning(self):
+    def test_partial_data_warning(self, lga_years):
         """Test that partial data availability triggers a warning."""
-        import warnings
-
-        from weathervault.stations import get_years_for_station
-
-        # Get actual available years for the station
-        available_years = get_years_for_station("725030-14732")
-        if not available_years:
+        if not lga_years:
             pytest.skip("No available years found for test station")
 
         # Request mix of available and unavailable years
-        available_year = available_years[-1]  # Most recent available year
+        available_year = lga_years[-1]  # Most recent available year
         unavailable_year = 1900  # Should not be available
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
+        with pytest.warns(
+            UserWarning, match=rf"Partial data returned.*{unavailable_year}.*{available_year}"
+        ):
             result = get_weather_data("725030-14732", years=[available_year, unavailable_year])
 
-            # Should have issued a warning
-            assert len(w) == 1
-            assert issubclass(w[0].category, UserWarning)
-            assert "Partial data returned" in str(w[0].message)
-            assert str(unavailable_year) in str(w[0].message)
-            assert str(available_year) in str(w[0].message)
-
         # Should still return data for the available year
         assert isinstance(result, pl.DataFrame)
         assert result.height > 0
-        years_in_data = result["time"].dt.year().unique().to_list()
-        assert available_year in years_in_data
+        assert result.select(pl.col("time").dt.year().eq(available_year).any()).item()
 
     @pytest.mark.network
-    def test_all_years_available_no_warning(self):
+    @pytest.mark.filterwarnings("error:Partial data:UserWarning")
+    def test_all_years_available_no_warning(self, lga_years):
         """Test that no warning is issued when all requested years are available."""
-        import warnings
-
-        from weathervault.stations import get_years_for_station
-
-        # Get actual available years for the station
-        available_years = get_years_for_station("725030-14732")
-        if len(available_years) < 2:
+        if len(lga_years) < 2:
             pytest.skip("Not enough available years for test")
 
         # Request only available years
-        years_to_request = available_years[-2:]  # Last 2 available years
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = get_weather_data("725030-14732", years=years_to_request)
+        years_to_request = lga_years[-2:]  # Last 2 available years
 
-            # Should not have issued any warnings
-            partial_warnings = [warning for warning in w if "Partial data" in str(warning.message)]
-            assert len(partial_warnings) == 0
+        # A partial-data warning is turned into an error by the filterwarnings mark
+        result = get_weather_data("725030-14732", years=years_to_request)
 
         assert isinstance(result, pl.DataFrame)
         assert result.height > 0
@@ -669,38 +756,28 @@ class TestYearAvailabilityWarnings:
         assert "years total" in error_msg
 
     @pytest.mark.network
-    def test_quiet_suppresses_partial_data_warning(self):
+    @pytest.mark.filterwarnings("error:Partial data:UserWarning")
+    def test_quiet_suppresses_partial_data_warning(self, lga_years):
         """Test that quiet=True suppresses the partial data warning."""
-        import warnings
-
-        from weathervault.stations import get_years_for_station
-
-        # Get actual available years for the station
-        available_years = get_years_for_station("725030-14732")
-        if not available_years:
+        if not lga_years:
             pytest.skip("No available years found for test station")
 
         # Request mix of available and unavailable years
-        available_year = available_years[-1]
+        available_year = lga_years[-1]
         unavailable_year = 1900
 
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            result = get_weather_data(
-                "725030-14732",
-                years=[available_year, unavailable_year],
-                quiet=True,
-            )
-
-            # Should NOT have issued any warnings
-            partial_warnings = [warning for warning in w if "Partial data" in str(warning.message)]
-            assert len(partial_warnings) == 0
+        result = get_weather_data(
+            "725030-14732",
+            years=[available_year, unavailable_year],
+            quiet=True,
+        )
 
         # Should still return data for the available year
         assert isinstance(result, pl.DataFrame)
         assert result.height > 0
 
 
+@pytest.mark.usefixtures("mocked_station")
 class TestYearAvailabilityMocked:
     """Mocked tests for year availability logic.
 
@@ -708,33 +785,8 @@ class TestYearAvailabilityMocked:
     all conditional paths without network access.
     """
 
-    @pytest.fixture
-    def mock_station_df(self):
-        """Create a mock station metadata DataFrame."""
-        return pl.DataFrame(
-            {
-                "id": ["725030-14732"],
-                "tz_name": ["America/New_York"],
-                "name": ["LA GUARDIA AIRPORT"],
-                "country": ["United States"],
-                "state": ["NY"],
-                "icao": ["KLGA"],
-                "lat": [40.779],
-                "lon": [-73.88],
-                "elev": [3.4],
-            }
-        )
-
-    def test_all_requested_years_unavailable_raises_error(self, monkeypatch, mock_station_df):
+    def test_all_requested_years_unavailable_raises_error(self):
         """Test error when none of the requested years are available."""
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
 
         with pytest.raises(ValueError) as exc_info:
             get_weather_data("725030-14732", years=[1990, 1991, 1992])
@@ -748,72 +800,26 @@ class TestYearAvailabilityMocked:
         assert "4 years total" in error_msg
         assert "get_years_for_station" in error_msg
 
-    def test_partial_years_available_warns(self, monkeypatch, mock_station_df):
+    def test_partial_years_available_warns(self):
         """Test warning when only some requested years are available."""
-        import warnings
-
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr(
-            "weathervault.weather._fetch_year_data",
-            lambda station_id, year, cache_path=None: None,
-        )
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            # Request mix: 2022, 2023 available; 1990 not available
+        # Request mix: 2022, 2023 available; 1990 not available
+        with pytest.warns(
+            UserWarning,
+            match=r"Partial data returned.*1990.*2022, 2023.*"
+            r"Available years for this station: 2020-2023",
+        ) as record:
             get_weather_data("725030-14732", years=[1990, 2022, 2023])
 
-            partial_warnings = [
-                warning for warning in w if "Partial data returned" in str(warning.message)
-            ]
-            assert len(partial_warnings) == 1
-            warning_msg = str(partial_warnings[0].message)
-            assert "1990" in warning_msg
-            assert "2022" in warning_msg
-            assert "2023" in warning_msg
-            assert "Available years for this station: 2020-2023" in warning_msg
-
-    def test_partial_years_quiet_suppresses_warning(self, monkeypatch, mock_station_df):
-        """Test that quiet=True suppresses partial data warning."""
-        import warnings
-
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr(
-            "weathervault.weather._fetch_year_data",
-            lambda station_id, year, cache_path=None: None,
-        )
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            get_weather_data("725030-14732", years=[1990, 2022], quiet=True)
+        assert len(record) == 1
 
-            partial_warnings = [warning for warning in w if "Partial data" in str(warning.message)]
-            assert len(partial_warnings) == 0
+    @pytest.mark.filterwarnings("error:Partial data:UserWarning")
+    def test_partial_years_quiet_suppresses_warning(self):
+        """Test that quiet=True suppresses partial data warning."""
+        get_weather_data("725030-14732", years=[1990, 2022], quiet=True)
 
-    def test_no_inventory_for_station_raises_error(self, monkeypatch, mock_station_df):
+    def test_no_inventory_for_station_raises_error(self, monkeypatch, mocked_station):
         """Test error when station exists but has no inventory data."""
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
+        mocked_station.set_available([])
         # Mock bundled data to return empty (simulate no bundled data for this station)
         monkeypatch.setattr(
             "weathervault.weather._get_bundled_years",
@@ -827,40 +833,13 @@ class TestYearAvailabilityMocked:
         assert "No data inventory found" in error_msg
         assert "725030-14732" in error_msg
 
-    def test_all_years_available_no_warning(self, monkeypatch, mock_station_df):
+    @pytest.mark.filterwarnings("error:Partial data:UserWarning")
+    def test_all_years_available_no_warning(self):
         """Test no warning when all requested years are available."""
-        import warnings
+        get_weather_data("725030-14732", years=[2022, 2023])
 
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr(
-            "weathervault.weather._fetch_year_data",
-            lambda station_id, year, cache_path=None: None,
-        )
-
-        with warnings.catch_warnings(record=True) as w:
-            warnings.simplefilter("always")
-            get_weather_data("725030-14732", years=[2022, 2023])
-
-            partial_warnings = [warning for warning in w if "Partial data" in str(warning.message)]
-            assert len(partial_warnings) == 0
-
-    def test_single_unavailable_year_error_format(self, monkeypatch, mock_station_df):
+    def test_single_unavailable_year_error_format(self):
         """Test error message format for single unavailable year."""
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
 
         with pytest.raises(ValueError) as exc_info:
             get_weather_data("725030-14732", years=1985)
@@ -869,122 +848,209 @@ class TestYearAvailabilityMocked:
         assert "No data available for station '725030-14732' for year(s) 1985" in error_msg
         assert "Available years: 2020-2023" in error_msg
 
-    def test_years_none_uses_all_available(self, monkeypatch, mock_station_df):
+    def test_years_none_uses_all_available(self, mocked_station):
         """Test that years=None fetches all available years."""
         available = [2021, 2022, 2023]
-        fetched_years = []
-
-        def mock_fetch(station_id, year, cache_path=None):
-            fetched_years.append(year)
-            return None
-
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: available,
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr("weathervault.weather._fetch_year_data", mock_fetch)
+        mocked_station.set_available(available)
 
         get_weather_data("725030-14732", years=None)
 
-        # Should have attempted to fetch all available years plus buffer years
-        # Buffer years (±1) are fetched to handle timezone offsets at year boundaries
-        # For years [2021, 2022, 2023], buffers add 2020 and 2024
-        expected_with_buffers = [2020, 2021, 2022, 2023, 2024]
-        assert sorted(fetched_years) == expected_with_buffers
+        # Should have attempted to fetch all available years; the buffer years (±1) used for
+        # timezone offsets at year boundaries, 2020 and 2024, have no file and are skipped
+        assert sorted(mocked_station.fetched_years) == available
 
-    def test_years_none_with_no_data_raises_error(self, monkeypatch, mock_station_df):
+    def test_years_none_with_no_data_raises_error(self, mocked_station):
         """Test that years=None with no available data raises error."""
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
+        mocked_station.set_available([])
 
         with pytest.raises(ValueError) as exc_info:
             get_weather_data("725030-14732", years=None)
 
         assert "No data available for station" in str(exc_info.value)
 
-    def test_buffer_years_fetched_for_timezone_conversion(self, monkeypatch, mock_station_df):
+    def test_buffer_years_fetched_for_timezone_conversion(self, mocked_station):
         """Test that buffer years are fetched when converting to local time.
 
         When convert_to_local=True, adjacent years are fetched to ensure complete
         data at year boundaries after timezone offset is applied.
         """
-        fetched_years = []
-
-        def mock_fetch(station_id, year, cache_path=None):
-            fetched_years.append(year)
-            return None
-
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr("weathervault.weather._fetch_year_data", mock_fetch)
-
         # Request just 2022
         get_weather_data("725030-14732", years=2022, convert_to_local=True)
 
         # Should fetch 2021, 2022, 2023 (requested year ± 1)
-        assert sorted(fetched_years) == [2021, 2022, 2023]
+        assert sorted(mocked_station.fetched_years) == [2021, 2022, 2023]
 
-    def test_no_buffer_years_when_convert_to_local_false(self, monkeypatch, mock_station_df):
+    def test_no_buffer_years_when_convert_to_local_false(self, mocked_station):
         """Test that buffer years are NOT fetched when keeping UTC time."""
-        fetched_years = []
-
-        def mock_fetch(station_id, year, cache_path=None):
-            fetched_years.append(year)
-            return None
-
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: [2020, 2021, 2022, 2023],
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
-        monkeypatch.setattr("weathervault.weather._fetch_year_data", mock_fetch)
-
         # Request just 2022 with UTC time (no conversion)
         get_weather_data("725030-14732", years=2022, convert_to_local=False)
 
         # Should only fetch 2022 (no buffer years needed)
-        assert sorted(fetched_years) == [2022]
+        assert sorted(mocked_station.fetched_years) == [2022]
 
-    def test_buffer_years_for_non_contiguous_years(self, monkeypatch, mock_station_df):
+    def test_buffer_years_for_non_contiguous_years(self, mocked_station):
         """Test buffer years for non-contiguous year requests like [1950, 1960]."""
-        fetched_years = []
+        # Provide a wide range of available years
+        mocked_station.set_available(list(range(1945, 1970)))
+
+        # Request 1950 and 1960
+        get_weather_data("725030-14732", years=[1950, 1960], convert_to_local=True)
+
+        # Should fetch: 1949, 1950, 1951 (for 1950) and 1959, 1960, 1961 (for 1960)
+        assert sorted(mocked_station.fetched_years) == [1949, 1950, 1951, 1959, 1960, 1961]
+
+    def test_buffer_years_limited_to_available(self, mocked_station):
+        """Test that buffer years outside the station's inventory aren't fetched."""
+        # 2020 and 2023 are the first and last available years (2019 and 2024 have no file)
+        get_weather_data("725030-14732", years=[2020, 2023], convert_to_local=True)
+
+        assert sorted(mocked_station.fetched_years) == [2020, 2021, 2022, 2023]
+
+    def test_years_fetched_concurrently(self, monkeypatch):
+        """Test that the station-year downloads overlap instead of running one by one."""
+        # Each fetch waits for the other two, which only succeeds if all three are in flight
+        barrier = threading.Barrier(3, timeout=5)
 
         def mock_fetch(station_id, year, cache_path=None):
-            fetched_years.append(year)
+            barrier.wait()
             return None
 
-        # Provide a wide range of available years
-        monkeypatch.setattr(
-            "weathervault.weather.get_years_for_station",
-            lambda station_id: list(range(1945, 1970)),
-        )
-        monkeypatch.setattr(
-            "weathervault.weather.get_station_metadata",
-            lambda **kwargs: mock_station_df,
-        )
         monkeypatch.setattr("weathervault.weather._fetch_year_data", mock_fetch)
 
-        # Request 1950 and 1960
-        get_weather_data("725030-14732", years=[1950, 1960], convert_to_local=True)
+        get_weather_data("725030-14732", years=2022, convert_to_local=True)
 
-        # Should fetch: 1949, 1950, 1951 (for 1950) and 1959, 1960, 1961 (for 1960)
-        assert sorted(fetched_years) == [1949, 1950, 1951, 1959, 1960, 1961]
+
+class TestBundledYears:
+    """Tests for bundled sample data lookup."""
+
+    def test_unknown_station_has_no_bundled_years(self):
+        """Test that a station without bundled files returns an empty set."""
+        from weathervault.weather import _get_bundled_years
+
+        assert _get_bundled_years("000000-00000") == frozenset()
+
+    def test_bundled_years_cached(self):
+        """Test that repeated lookups reuse the cached result."""
+        from weathervault.weather import _get_bundled_years
+
+        _get_bundled_years.cache_clear()
+        first = _get_bundled_years("725030-14732")
+        second = _get_bundled_years("725030-14732")
+
+        assert first is second
+        assert _get_bundled_years.cache_info().hits >= 1
+
+
+class TestFetchCache:
+    """Tests for caching downloaded ISD files."""
+
+    @pytest.fixture
+    def serve(self, tmp_path, monkeypatch):
+        """Route NCEI downloads to a handler and run from an empty working directory."""
+        from weathervault import weather
+
+        monkeypatch.chdir(tmp_path)
+
+        def install(handler):
+            client = httpx.Client(transport=httpx.MockTransport(handler), follow_redirects=True)
+            monkeypatch.setattr(weather, "_client", client)
+
+        return install
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        """An empty cache directory."""
+        path = tmp_path / "cache"
+        path.mkdir()
+        return path
+
+    def test_download_written_to_cache_dir(self, serve, cache_dir):
+        """Test that a downloaded file is moved into the cache with no temporary file left."""
+        from weathervault import weather
+
+        serve(lambda request: httpx.Response(200, content=b"data"))
+
+        assert weather._fetch_year_data("000000-00000", 2023, cache_dir) == b"data"
+        assert [p.name for p in cache_dir.iterdir()] == ["000000-00000-2023.gz"]
+        assert (cache_dir / "000000-00000-2023.gz").read_bytes() == b"data"
+
+    def test_client_shared_between_downloads(self, monkeypatch):
+        """Test that every download goes through one lazily created client."""
+        from weathervault import weather
+
+        monkeypatch.setattr(weather, "_client", None)
+
+        client = weather._get_client()
+        assert weather._get_client() is client
+        client.close()
+
+    def test_past_year_cache_never_expires(self, serve, cache_dir):
+        """Test that an old cached file for a past year is used without downloading."""
+        from weathervault import weather
+
+        cached = cache_dir / "000000-00000-2023.gz"
+        cached.write_bytes(b"old")
+        os.utime(cached, (0, 0))
+        serve(lambda request: httpx.Response(500))
+
+        assert weather._fetch_year_data("000000-00000", 2023, cache_dir) == b"old"
+
+    def test_current_year_cache_refreshed_when_stale(self, serve, cache_dir):
+        """Test that an outdated cached file for the current year is downloaded again."""
+        from weathervault import weather
+
+        year = date.today().year
+        cached = cache_dir / f"000000-00000-{year}.gz"
+        cached.write_bytes(b"old")
+        serve(lambda request: httpx.Response(200, content=b"new"))
+
+        # A freshly cached file is reused as-is
+        assert weather._fetch_year_data("000000-00000", year, cache_dir) == b"old"
+
+        stale = time.time() - weather._CURRENT_YEAR_CACHE_MAX_AGE - 60
+        os.utime(cached, (stale, stale))
+
+        assert weather._fetch_year_data("000000-00000", year, cache_dir) == b"new"
+        assert cached.read_bytes() == b"new"
+
+    def test_stale_current_year_cache_used_offline(self, serve, cache_dir):
+        """Test that an outdated current-year file is still returned if the download fails."""
+        from weathervault import weather
+
+        def offline(request):
+            raise httpx.ConnectError("offline", request=request)
+
+        year = date.today().year
+        cached = cache_dir / f"000000-00000-{year}.gz"
+        cached.write_bytes(b"old")
+        os.utime(cached, (0, 0))
+        serve(offline)
+
+        assert weather._fetch_year_data("000000-00000", year, cache_dir) == b"old"
+
+    @pytest.mark.parametrize("status", [404, 500])
+    def test_stale_current_year_cache_used_on_error_response(self, serve, cache_dir, status):
+        """Test that an outdated current-year file is returned if NCEI answers with an error."""
+        from weathervault import weather
+
+        year = date.today().year
+        cached = cache_dir / f"000000-00000-{year}.gz"
+        cached.write_bytes(b"old")
+        os.utime(cached, (0, 0))
+        serve(lambda request: httpx.Response(status))
+
+        assert weather._fetch_year_data("000000-00000", year, cache_dir) == b"old"
+
+    def test_temporary_file_removed_when_cache_write_fails(self, serve, cache_dir, monkeypatch):
+        """Test that the temporary file is deleted if it cannot be moved into the cache."""
+        from weathervault import weather
+
+        def fail_replace(src, dst):
+            raise PermissionError(dst)
+
+        serve(lambda request: httpx.Response(200, content=b"data"))
+        monkeypatch.setattr(weather.os, "replace", fail_replace)
+
+        with pytest.raises(PermissionError):
+            weather._fetch_year_data("000000-00000", 2023, cache_dir)
+        assert list(cache_dir.iterdir()) == []
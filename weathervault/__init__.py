@@ -2,6 +2,11 @@
 weathervault: Obtain Polars DataFrames of historical weather data from the NCEI weather database.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
 try:
     from importlib.metadata import PackageNotFoundError, version
 except ImportError:  # pragma: no cover
@@ -16,13 +21,25 @@ from weathervault._constants import (
     state,
 )
 from weathervault._registry import station
-from weathervault.stations import (
-    get_countries,
-    get_inventory,
-    get_station_metadata,
-    search_stations,
-)
-from weathervault.weather import get_weather_data
+
+if TYPE_CHECKING:
+    from weathervault.stations import (
+        get_countries,
+        get_inventory,
+        get_station_metadata,
+        search_stations,
+    )
+    from weathervault.weather import get_weather_data
+
+# The data functions live in modules that import Polars and httpx, so they're only imported on
+# first access (PEP 562) and `import weathervault` stays cheap
+_LAZY_IMPORTS = {
+    "get_weather_data": "weathervault.weather",
+    "get_station_metadata": "weathervault.stations",
+    "search_stations": "weathervault.stations",
+    "get_inventory": "weathervault.stations",
+    "get_countries": "weathervault.stations",
+}
 
 try:  # pragma: no cover
     __version__ = version("weathervault")
@@ -48,3 +65,19 @@ __all__ = [
     # Version
     "__version__",
 ]
+
+
+def __getattr__(name: str):
+    """Import a lazily loaded public function on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip this function
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily loaded functions alongside the module's current attributes."""
+    return sorted(set(globals()) | set(__all__))
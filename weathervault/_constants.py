@@ -1,5 +1,8 @@
 """Constants for weathervault package."""
 
+from itertools import accumulate
+from types import MappingProxyType
+
 # Base URL for NCEI NOAA data
 BASE_URL = "https://www.ncei.noaa.gov/pub/data/noaa"
 
@@ -80,29 +83,41 @@ MANDATORY_COLUMN_NAMES = [
     "sea_level_pressure_qc",
 ]
 
+# Total length of the mandatory section and the start offset of each column within
+# it (the final offset is the end of the section), computed once for the parser
+MANDATORY_SECTION_LENGTH = sum(MANDATORY_COLUMN_WIDTHS)
+MANDATORY_COLUMN_OFFSETS = tuple(accumulate(MANDATORY_COLUMN_WIDTHS, initial=0))
+
+# The internal lookup tables below are read-only views so that callers can share them
+# without taking defensive copies; the tables re-exported as `wv.*` stay plain dicts
+
 # Missing value codes in ISD data
 # Reference: NOAA ISD Format Document
 # https://www.ncei.noaa.gov/data/global-hourly/doc/isd-format-document.pdf
-MISSING_VALUES = {
-    "wind_direction": 999,  # POS 61-63: 999 = Missing
-    "wind_speed": 9999,  # POS 66-69: 9999 = Missing
-    "ceiling_height": 99999,  # POS 71-75: 99999 = Missing
-    "visibility": 999999,  # POS 79-84: 999999 = Missing
-    "temp": 9999,  # POS 88-92: +9999 = Missing (stored without sign)
-    "dew_point": 9999,  # POS 94-98: +9999 = Missing (stored without sign)
-    "sea_level_pressure": 99999,  # POS 100-104: 99999 = Missing
-}
+MISSING_VALUES = MappingProxyType(
+    {
+        "wind_direction": 999,  # POS 61-63: 999 = Missing
+        "wind_speed": 9999,  # POS 66-69: 9999 = Missing
+        "ceiling_height": 99999,  # POS 71-75: 99999 = Missing
+        "visibility": 999999,  # POS 79-84: 999999 = Missing
+        "temp": 9999,  # POS 88-92: +9999 = Missing (stored without sign)
+        "dew_point": 9999,  # POS 94-98: +9999 = Missing (stored without sign)
+        "sea_level_pressure": 99999,  # POS 100-104: 99999 = Missing
+    }
+)
 
 # Scale factors for numeric fields (divide by this to get actual value)
-SCALE_FACTORS = {
-    "wind_speed": 10,  # m/s with 1 decimal
-    "temp": 10,  # degrees C with 1 decimal
-    "dew_point": 10,  # degrees C with 1 decimal
-    "sea_level_pressure": 10,  # hectopascals with 1 decimal
-    "latitude": 1000,  # degrees with 3 decimals
-    "longitude": 1000,  # degrees with 3 decimals
-    "elevation": 1,  # meters (already in meters)
-}
+SCALE_FACTORS = MappingProxyType(
+    {
+        "wind_speed": 10,  # m/s with 1 decimal
+        "temp": 10,  # degrees C with 1 decimal
+        "dew_point": 10,  # degrees C with 1 decimal
+        "sea_level_pressure": 10,  # hectopascals with 1 decimal
+        "latitude": 1000,  # degrees with 3 decimals
+        "longitude": 1000,  # degrees with 3 decimals
+        "elevation": 1,  # meters (already in meters)
+    }
+)
 
 # FIPS country codes to country names mapping
 # From https://www.ncei.noaa.gov/pub/data/noaa/country-list.txt
@@ -916,17 +931,17 @@ class _CountryCodes:
 
     def __getattr__(self, name: str) -> str:
         """Return the ISO country code (same as the attribute name)."""
-        code = name.upper()
-        if code in ISO_COUNTRY_NAMES:
+        # Every code has two characters, so anything else is rejected before upper-casing
+        if len(name) == 2 and (code := name.upper()) in ISO_COUNTRY_NAMES:
             return code
         raise AttributeError(
-            f"'{code}' is not a valid ISO 3166-1 alpha-2 country code. "
+            f"'{name.upper()}' is not a valid ISO 3166-1 alpha-2 country code. "
             f"See wv.ISO_COUNTRY_NAMES for valid codes."
         )
 
     def __dir__(self):
         """Return list of all valid ISO country codes for autocomplete."""
-        return list(ISO_COUNTRY_NAMES.keys())
+        return sorted(ISO_COUNTRY_NAMES)
 
     def __repr__(self) -> str:
         return f"<CountryCodes: {len(ISO_COUNTRY_NAMES)} ISO 3166-1 alpha-2 codes>"
@@ -951,17 +966,17 @@ class _StateCodes:
 
     def __getattr__(self, name: str) -> str:
         """Return the US state code (same as the attribute name)."""
-        code = name.upper()
-        if code in US_STATE_NAMES:
+        # Every code has two characters, so anything else is rejected before upper-casing
+        if len(name) == 2 and (code := name.upper()) in US_STATE_NAMES:
             return code
         raise AttributeError(
-            f"'{code}' is not a valid US state or territory code. "
+            f"'{name.upper()}' is not a valid US state or territory code. "
             f"See wv.US_STATE_NAMES for valid codes."
         )
 
     def __dir__(self):
         """Return list of all valid US state codes for autocomplete."""
-        return list(US_STATE_NAMES.keys())
+        return sorted(US_STATE_NAMES)
 
     def __repr__(self) -> str:
         return f"<StateCodes: {len(US_STATE_NAMES)} US states and territories>"
@@ -3,14 +3,13 @@
 from __future__ import annotations
 
 import gzip
-import io
 from typing import TYPE_CHECKING
 
 import polars as pl
 
 from weathervault._constants import (
     MANDATORY_COLUMN_NAMES,
-    MANDATORY_COLUMN_WIDTHS,
+    MANDATORY_COLUMN_OFFSETS,
     MISSING_VALUES,
     SCALE_FACTORS,
 )
@@ -18,6 +17,21 @@ from weathervault._constants import (
 if TYPE_CHECKING:
     pass
 
+# (name, start, end) for each mandatory column, so lines are sliced without
+# re-accumulating the column widths for every record
+_MANDATORY_FIELDS = tuple(
+    zip(
+        MANDATORY_COLUMN_NAMES,
+        MANDATORY_COLUMN_OFFSETS[:-1],
+        MANDATORY_COLUMN_OFFSETS[1:],
+        strict=True,
+    )
+)
+
+
+# First two bytes of every gzip stream
+_GZIP_MAGIC = b"\x1f\x8b"
+
 
 def parse_isd_line(line: str) -> dict:
     """
@@ -34,18 +48,15 @@ def parse_isd_line(line: str) -> dict:
         Dictionary containing parsed values from the mandatory data section.
     """
     values = {}
-    pos = 0
+    line_length = len(line)
 
-    for _i, (name, width) in enumerate(
-        zip(MANDATORY_COLUMN_NAMES, MANDATORY_COLUMN_WIDTHS, strict=True)
-    ):
-        if pos + width > len(line):
+    for name, start, end in _MANDATORY_FIELDS:
+        if end > line_length:
             # Line is shorter than expected, fill with None
             values[name] = None
         else:
-            raw_value = line[pos : pos + width].strip()
+            raw_value = line[start:end].strip()
             values[name] = raw_value if raw_value else None
-        pos += width
 
     return values
 
@@ -64,34 +75,28 @@ def parse_isd_data(data: bytes | str) -> pl.DataFrame:
     pl.DataFrame
         DataFrame containing the parsed weather observations.
     """
-    # Handle gzipped data
+    # Handle gzipped data, recognized by the gzip magic number so plain text is decoded
+    # directly instead of first failing a decompression attempt
     if isinstance(data, bytes):
-        try:
-            # Try to decompress as gzip
-            with gzip.GzipFile(fileobj=io.BytesIO(data)) as f:
-                text = f.read().decode("utf-8", errors="replace")
-        except gzip.BadGzipFile:
-            # Not gzipped, decode directly
-            text = data.decode("utf-8", errors="replace")
+        if data[:2] == _GZIP_MAGIC:
+            data = gzip.decompress(data)
+        text = data.decode("utf-8", errors="replace")
     else:
         text = data
 
-    lines = text.strip().split("\n")
-    if not lines:  # pragma: no cover
-        return _empty_weather_dataframe()
-
-    # Parse each line
-    records = []
-    for line in lines:
-        if line.strip():
-            record = parse_isd_line(line)
-            records.append(record)
-
-    if not records:
-        return _empty_weather_dataframe()
-
-    # Create DataFrame from records
-    df = pl.DataFrame(records)
+    # Slice every mandatory field out of all lines at once with Polars string kernels rather
+    # than building a dict per line; as in `parse_isd_line()`, a field that runs past the end of
+    # a short line or is blank after stripping becomes null
+    line = pl.col("line")
+    df = (
+        pl.DataFrame({"line": text.strip().split("\n")}, schema={"line": pl.Utf8})
+        .filter(line.str.strip_chars() != "")
+        .select(
+            pl.when((line.str.len_chars() >= end) & (field != "")).then(field).alias(name)
+            for name, start, end in _MANDATORY_FIELDS
+            for field in [line.str.slice(start, end - start).str.strip_chars()]
+        )
+    )
 
     return df
 
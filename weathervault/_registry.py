@@ -2,14 +2,39 @@
 
 from __future__ import annotations
 
+import contextlib
+import gzip
+import os
+import pickle
 import re
+import sys
+import tempfile
+import time
+from bisect import bisect_right
 from functools import lru_cache
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import polars as pl
 
 
+# Maps each Latin-1 character straight to its sanitized form: the upper-cased character when
+# that is made of A-Z/0-9 only (e.g. "a" -> "A", "ß" -> "SS"), otherwise a space separator
+_SANITIZE_TABLE = str.maketrans(
+    {chr(i): re.sub(r"[^A-Z0-9]+", " ", chr(i).upper()) for i in range(256)}
+)
+
+
+# How long a registry cache file written by `station.load(cache_dir=...)` stays valid
+_REGISTRY_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # seconds
+
+# Joins station names in the search index; sanitized names can't contain it
+_SEARCH_SEPARATOR = "\n"
+
+
+# Many historical stations share a name with their successors, so memoize per name
+@lru_cache(maxsize=1 << 16)
 def _sanitize_name(name: str) -> str:
     """Convert station name to valid Python identifier.
 
@@ -20,10 +45,18 @@ def _sanitize_name(name: str) -> str:
     """
     if not name:
         return "UNKNOWN"
-    # Replace non-alphanumeric with underscore, collapse multiple underscores
-    sanitized = re.sub(r"[^A-Z0-9]+", "_", name.upper())
-    # Remove leading/trailing underscores
-    sanitized = sanitized.strip("_")
+    # Upper-case and blank out separators in one pass; the table only covers Latin-1, so
+    # anything left over that isn't ASCII means the name needs the general path
+    translated = name.translate(_SANITIZE_TABLE)
+    if translated.isascii():
+        # Join the remaining runs with single underscores (this also drops leading/trailing
+        # separators)
+        sanitized = "_".join(translated.split())
+    else:
+        # Replace non-alphanumeric with underscore, collapse multiple underscores
+        sanitized = re.sub(r"[^A-Z0-9]+", "_", name.upper())
+        # Remove leading/trailing underscores
+        sanitized = sanitized.strip("_")
     # Ensure it doesn't start with a number
     if sanitized and sanitized[0].isdigit():
         sanitized = "_" + sanitized
@@ -45,6 +78,9 @@ class _StationNamespace:
     country and optionally state.
     """
 
+    # Thousands of namespaces are created, so avoid a per-instance __dict__
+    __slots__ = ("_stations", "_children", "_ci_index", "_dir_cache")
+
     def __init__(
         self,
         stations: dict[str, str] | None = None,
@@ -58,28 +94,40 @@ class _StationNamespace:
         """
         self._stations = stations or {}
         self._children = children or {}
+        # Upper-cased index for case-insensitive lookups, built on first use
+        self._ci_index: dict[str, _StationNamespace | str] | None = None
+        # Sorted attribute names, built on the first dir() call
+        self._dir_cache: tuple[str, ...] | None = None
+
+    def _get_ci_index(self) -> dict[str, _StationNamespace | str]:
+        """Return the index of upper-cased names used for case-insensitive lookups.
+
+        Children are indexed before stations so they take precedence, and when several names
+        differ only in case the first one wins, matching the order of a scan over the dicts.
+        """
+        if self._ci_index is None:
+            index: dict[str, _StationNamespace | str] = {}
+            for key, value in self._children.items():
+                index.setdefault(key.upper(), value)
+            for key, value in self._stations.items():
+                index.setdefault(key.upper(), value)
+            self._ci_index = index
+        return self._ci_index
 
     def __getattr__(self, name: str) -> _StationNamespace | str:
         """Get a child namespace or station ID."""
         if name.startswith("_"):
             raise AttributeError(name)
 
-        # Check children first (country codes, states)
-        if name in self._children:
-            return self._children[name]
-
-        # Then check stations
-        if name in self._stations:
-            return self._stations[name]
-
-        # Try case-insensitive match
-        name_upper = name.upper()
-        for key, value in self._children.items():
-            if key.upper() == name_upper:
-                return value
-        for key, value in self._stations.items():
-            if key.upper() == name_upper:
-                return value
+        # Check children first (country codes, states), then stations, then try a
+        # case-insensitive match
+        value = self._children.get(name)
+        if value is None:
+            value = self._stations.get(name)
+        if value is None:
+            value = self._get_ci_index().get(name.upper())
+        if value is not None:
+            return value
 
         raise AttributeError(
             f"No station or group named '{name}'. Use dir() to see available options."
@@ -87,7 +135,10 @@ class _StationNamespace:
 
     def __dir__(self) -> list[str]:
         """Return list of available attributes for autocomplete."""
-        return sorted(set(list(self._children.keys()) + list(self._stations.keys())))
+        if self._dir_cache is None:
+            self._dir_cache = tuple(sorted(self._children.keys() | self._stations.keys()))
+        # Hand out a copy so callers can't mutate the cached names
+        return list(self._dir_cache)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -131,68 +182,138 @@ class _StationRegistry(_StationNamespace):
         '725030-14732'
         >>> station.DE.BERLIN_TEGEL  # Germany (ISO: DE, FIPS: GM)
         '103820-99999'
+
+    The hierarchy is built on first access. Call `station.load(cache_dir=...)` to reuse a
+    pickled copy of it across sessions instead of rebuilding it from the station metadata.
     """
 
+    __slots__ = ("_loaded", "_search_index")
+
     def __init__(self) -> None:
         """Initialize empty registry (loads on first access)."""
         super().__init__()
         self._loaded = False
+        # (names, starts, entries) used by search(), built on first search
+        self._search_index: tuple[str, list[int], list[tuple[str, str]]] | None = None
 
     def _ensure_loaded(self) -> None:
         """Load station data if not already loaded."""
         if self._loaded:
             return
 
+        import polars as pl
+
         df = _get_stations_df()
 
         # Sort by end_date descending so active stations are processed last
         # (and thus override older stations with the same name)
         df = df.sort("end_date", descending=False, nulls_last=False)
 
-        # Build hierarchy by ISO country code
-        country_groups: dict[str, dict[str, dict[str, str] | str]] = {}
-
-        for row in df.iter_rows(named=True):
-            station_id = row["id"]
-            name = row["name"] or ""
-            fips_code = row["country_code"] or "XX"
+        # Sanitize and convert each distinct name / country code once, then map the results
+        # back onto the columns; names are interned so they share storage and compare by
+        # identity with attribute names, which Python interns when compiling
+        # `station.US.NY.<NAME>`
+        names = df.get_column("name").fill_null("").unique().to_list()
+        fips_codes = df.get_column("country_code").fill_null("XX").unique().to_list()
+        df = df.select(
+            pl.col("id"),
+            pl.col("name")
+            .fill_null("")
+            .replace_strict({name: sys.intern(_sanitize_name(name)) for name in names})
+            .alias("sanitized_name"),
             # Convert FIPS to ISO for user-facing interface
-            country_code = _fips_to_iso(fips_code)
-            state = row["state"]
-
-            sanitized_name = _sanitize_name(name)
-
-            if country_code not in country_groups:
-                country_groups[country_code] = {}
-
-            # For US stations, add state level
-            if country_code == "US" and state:
-                if state not in country_groups[country_code]:
-                    country_groups[country_code][state] = {}
-                state_dict = country_groups[country_code][state]
-                if isinstance(state_dict, dict):  # pragma: no branch
-                    # Overwrite if same name (newer station replaces older)
-                    state_dict[sanitized_name] = station_id
-            else:
-                # For non-US, put directly under country
-                country_groups[country_code][sanitized_name] = station_id
+            pl.col("country_code")
+            .fill_null("XX")
+            .replace_strict({code: _fips_to_iso(code or "XX") for code in fips_codes})
+            .alias("country_code"),
+            pl.col("state"),
+        ).with_columns(
+            # Only US stations get a state level; everything else sits directly under its country
+            pl.when((pl.col("country_code") == "US") & (pl.col("state") != ""))
+            .then(pl.col("state"))
+            .alias("state")
+        )
+
+        # Where several stations share a name within a country/state, keep only the one with
+        # the latest end_date (the last in sort order), so active stations win over old ones
+        df = df.unique(
+            subset=["country_code", "state", "sanitized_name"], keep="last", maintain_order=True
+        )
+
+        # Collect each (country, state) group's names and IDs in one columnar pass, so only
+        # group-level work is left to Python
+        grouped = df.group_by(["country_code", "state"], maintain_order=True).agg(
+            pl.col("sanitized_name"), pl.col("id")
+        )
 
         # Build namespace tree
-        for country_code, content in country_groups.items():
-            children: dict[str, _StationNamespace] = {}
-            stations: dict[str, str] = {}
+        country_groups: dict[str, tuple[dict[str, str], dict[str, dict[str, str]]]] = {}
+        for country_code, state, sanitized_names, station_ids in grouped.iter_rows():
+            stations, states = country_groups.setdefault(sys.intern(country_code), ({}, {}))
+            if state is not None:
+                stations = states.setdefault(sys.intern(state), {})
+            stations.update(zip(sanitized_names, station_ids, strict=True))
+
+        countries: dict[str, _StationNamespace] = {
+            country_code: _StationNamespace(
+                stations=stations,
+                children={state: _StationNamespace(stations=s) for state, s in states.items()},
+            )
+            for country_code, (stations, states) in country_groups.items()
+        }
+
+        self._set_countries(countries)
+
+    def _set_countries(self, countries: dict[str, _StationNamespace]) -> None:
+        """Install the country namespaces and reset anything derived from them."""
+        self._children = countries
+        self._ci_index = None
+        self._dir_cache = None
+        self._search_index = None
+        self._loaded = True
 
-            for key, value in content.items():
-                if isinstance(value, dict):
-                    # It's a state with stations
-                    children[key] = _StationNamespace(stations=value)
-                else:
-                    # It's a station directly under country
-                    stations[key] = value
+    def load(
+        self,
+        *,
+        cache_dir: str | Path | None = None,
+        force_refresh: bool = False,
+    ) -> _StationRegistry:
+        """Build the station hierarchy now instead of on first attribute access.
 
-            self._children[country_code] = _StationNamespace(stations=stations, children=children)
+        Args:
+            cache_dir: Directory for a pickled copy of the hierarchy. If a copy written by this
+                version of weathervault within the last 7 days exists there it is loaded instead
+                of building the hierarchy from the station metadata; otherwise the hierarchy is
+                built and then saved there.
+            force_refresh: Re-download the station metadata and rebuild the hierarchy, even if it
+                is already loaded or cached.
 
-        self._loaded = True
+        Returns:
+            The registry itself, so that it can be used as `station.load(...).US.NY`.
+        """
+        cache_file = _registry_cache_file(cache_dir) if cache_dir else None
+
+        if force_refresh:
+            from weathervault.stations import get_station_metadata
+
+            _get_stations_df.cache_clear()
+            get_station_metadata(include_timezone=False, force_refresh=True)
+            self._loaded = False
+        elif self._loaded:
+            # Already built in memory, but still save it if there is no current copy yet
+            if cache_file is not None and not _registry_cache_is_current(cache_file):
+                _write_registry_cache(cache_file, self._children)
+            return self
+        elif cache_file is not None:
+            countries = _read_registry_cache(cache_file)
+            if countries is not None:
+                self._set_countries(countries)
+                return self
+
+        self._ensure_loaded()
+        if cache_file is not None:
+            _write_registry_cache(cache_file, self._children)
+        return self
 
     def __getattr__(self, name: str) -> _StationNamespace | str:
         """Get a child namespace or station ID, loading data if needed."""
@@ -226,23 +347,104 @@ class _StationRegistry(_StationNamespace):
             {'US.NY.LAGUARDIA_AP': '725030-14732'}
         """
         self._ensure_loaded()
-        results: dict[str, str] = {}
+        names, starts, entries = self._get_search_index()
         pattern_upper = pattern.upper()
 
-        for country_code, country_ns in self._children.items():
-            # Check stations directly under country
-            for name, station_id in country_ns._stations.items():
-                if pattern_upper in name.upper():
-                    results[f"{country_code}.{name}"] = station_id
+        if not pattern_upper:
+            return dict(entries)
+        if _SEARCH_SEPARATOR in pattern_upper:
+            # Station names never contain the separator, so nothing can match
+            return {}
 
-            # Check states/children
-            for state, state_ns in country_ns._children.items():
-                for name, station_id in state_ns._stations.items():
-                    if pattern_upper in name.upper():
-                        results[f"{country_code}.{state}.{name}"] = station_id
+        # Find every occurrence in the joined names, map each to the entry containing it and
+        # resume the search at the next entry so each station is reported once, in order
+        results: dict[str, str] = {}
+        pos = names.find(pattern_upper)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            path, station_id = entries[i]
+            results[path] = station_id
+            if i + 1 == len(starts):
+                break
+            pos = names.find(pattern_upper, starts[i + 1])
 
         return results
 
+    def _get_search_index(self) -> tuple[str, list[int], list[tuple[str, str]]]:
+        """Return the index used by search(), building it if needed.
+
+        The index holds every station as a (full path, station ID) entry, in the order stations
+        are visited (per country: its own stations, then each state's), along with all upper-cased
+        station names joined into one string and the offset at which each entry's name starts.
+        """
+        if self._search_index is None:
+            upper_names: list[str] = []
+            entries: list[tuple[str, str]] = []
+            for country_code, country_ns in self._children.items():
+                # Stations directly under country
+                for name, station_id in country_ns._stations.items():
+                    upper_names.append(name.upper())
+                    entries.append((f"{country_code}.{name}", station_id))
+                # States/children
+                for state, state_ns in country_ns._children.items():
+                    for name, station_id in state_ns._stations.items():
+                        upper_names.append(name.upper())
+                        entries.append((f"{country_code}.{state}.{name}", station_id))
+
+            starts: list[int] = []
+            offset = 0
+            for name in upper_names:
+                starts.append(offset)
+                offset += len(name) + len(_SEARCH_SEPARATOR)
+            self._search_index = (_SEARCH_SEPARATOR.join(upper_names), starts, entries)
+        return self._search_index
+
+
+def _registry_cache_file(cache_dir: str | Path) -> Path:
+    """Return the registry cache path for this version of weathervault."""
+    from weathervault import __version__
+
+    return Path(cache_dir) / f"station-registry-{__version__}.pickle.gz"
+
+
+def _registry_cache_is_current(cache_file: Path) -> bool:
+    """Return whether the registry cache file exists and is recent enough to be used."""
+    try:
+        return time.time() - cache_file.stat().st_mtime <= _REGISTRY_CACHE_MAX_AGE
+    except OSError:
+        return False
+
+
+def _read_registry_cache(cache_file: Path) -> dict[str, _StationNamespace] | None:
+    """Load pickled country namespaces, or return None if the file is missing or stale."""
+    if not _registry_cache_is_current(cache_file):
+        return None
+    try:
+        with gzip.open(cache_file, "rb") as f:
+            countries = pickle.load(f)
+    except Exception:
+        # A missing, truncated or otherwise unreadable cache just means rebuilding
+        return None
+    return countries if isinstance(countries, dict) else None
+
+
+def _write_registry_cache(cache_file: Path, countries: dict[str, _StationNamespace]) -> None:
+    """Pickle the country namespaces, replacing any existing cache file atomically."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    # A uniquely named temporary file keeps concurrent writers apart and is removed on failure
+    with tempfile.NamedTemporaryFile(
+        dir=cache_file.parent, prefix=f"{cache_file.name}.", suffix=".tmp", delete=False
+    ) as tmp_file:
+        try:
+            with gzip.GzipFile(fileobj=tmp_file, mode="wb") as f:
+                pickle.dump(countries, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_file.close()
+            os.replace(tmp_file.name, cache_file)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(tmp_file.name)
+            raise
+
 
 # Singleton instance
 station = _StationRegistry()
@@ -18,6 +18,9 @@ if TYPE_CHECKING:
 _station_metadata_cache: pl.DataFrame | None = None
 _station_metadata_cache_has_tz: bool = False
 _inventory_cache: pl.DataFrame | None = None
+_countries_cache: pl.DataFrame | None = None
+# Sorted years per station ID, with the inventory frame the index was built from
+_station_years_cache: tuple[pl.DataFrame, dict[str, list[int]]] | None = None
 _tf: TimezoneFinder | None = None
 
 
@@ -100,14 +103,24 @@ def get_station_metadata(
         response = client.get(url)
         response.raise_for_status()
 
+    # Read only the columns used below, all as strings: this skips schema inference, keeps
+    # leading zeros in the IDs and leaves numeric/date parsing to the explicit casts that follow
     df = pl.read_csv(
         io.BytesIO(response.content),
-        schema_overrides={
-            "USAF": pl.Utf8,
-            "WBAN": pl.Utf8,
-            "BEGIN": pl.Utf8,
-            "END": pl.Utf8,
-        },
+        columns=[
+            "USAF",
+            "WBAN",
+            "STATION NAME",
+            "CTRY",
+            "STATE",
+            "ICAO",
+            "LAT",
+            "LON",
+            "ELEV(M)",
+            "BEGIN",
+            "END",
+        ],
+        infer_schema_length=0,
     )
 
     # Rename columns to be more Pythonic
@@ -403,11 +416,15 @@ def search_stations(
     """
     df = get_station_metadata()
 
+    # Name/country filters are plain substring matches, so match literally rather than
+    # compiling the query as a regex (which would also choke on names like "ST. MARY (AK)")
     if name is not None:
-        df = df.filter(pl.col("name").str.to_lowercase().str.contains(name.lower()))
+        df = df.filter(pl.col("name").str.to_lowercase().str.contains(name.lower(), literal=True))
 
     if country is not None:
-        df = df.filter(pl.col("country").str.to_lowercase().str.contains(country.lower()))
+        df = df.filter(
+            pl.col("country").str.to_lowercase().str.contains(country.lower(), literal=True)
+        )
 
     if country_code is not None:
         # Filter by ISO country code (DataFrame now contains ISO codes)
@@ -461,13 +478,17 @@ def get_years_for_station(station_id: str) -> list[int]:
     years
     ```
     """
-    inventory = get_inventory()
-    station_data = inventory.filter(pl.col("id") == station_id)
+    global _station_years_cache
 
-    if station_data.height == 0:
-        return []
+    # Index the inventory by station once instead of scanning it on every call; the index is
+    # rebuilt whenever `get_inventory()` hands back a different (e.g. refreshed) frame
+    inventory = get_inventory()
+    if _station_years_cache is None or _station_years_cache[0] is not inventory:
+        years_by_station = inventory.group_by("id").agg(pl.col("year").sort())
+        _station_years_cache = (inventory, dict(years_by_station.iter_rows()))
 
-    return sorted(station_data["year"].to_list())
+    # Copy so callers can't modify the cached list
+    return list(_station_years_cache[1].get(station_id, ()))
 
 
 def get_countries() -> pl.DataFrame:
@@ -494,6 +515,12 @@ def get_countries() -> pl.DataFrame:
     countries
     ```
     """
+    global _countries_cache
+
+    # The table only depends on the bundled code mappings, so build it once
+    if _countries_cache is not None:
+        return _countries_cache
+
     # Create mapping from FIPS to ISO codes with country names
     iso_codes = []
     country_names = []
@@ -503,9 +530,10 @@ def get_countries() -> pl.DataFrame:
             iso_codes.append(FIPS_TO_ISO[fips_code])
             country_names.append(country_name)
 
-    return pl.DataFrame(
+    _countries_cache = pl.DataFrame(
         {
             "country_code": iso_codes,
             "country": country_names,
         }
     ).sort("country")
+    return _countries_cache
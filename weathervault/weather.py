@@ -4,8 +4,14 @@ from __future__ import annotations
 
 import contextlib
 import importlib.resources
+import os
+import tempfile
+import threading
+import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, timedelta
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -19,6 +25,43 @@ from weathervault.stations import get_station_metadata, get_years_for_station
 if TYPE_CHECKING:
     pass
 
+# Upper bound on simultaneous station-year downloads in `get_weather_data()`
+_MAX_FETCH_WORKERS = 8
+
+# Cached files for the current year are still growing upstream, so they're re-downloaded once
+# they are older than this
+_CURRENT_YEAR_CACHE_MAX_AGE = 6 * 60 * 60  # seconds
+
+# HTTP client shared by all station-year downloads, created on first use
+_client: httpx.Client | None = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    """Get or create the shared HTTP client for station-year downloads.
+
+    Reusing one client keeps connections to NCEI open between downloads, so the TCP and TLS
+    handshakes are paid once per pooled connection rather than once per file. The pool is sized
+    for the concurrent downloads in `get_weather_data()`, and `httpx.Client` is safe to share
+    between its threads.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = httpx.Client(
+                timeout=120.0,
+                follow_redirects=True,
+                transport=httpx.HTTPTransport(
+                    # Retry failed connection attempts (not HTTP error responses)
+                    retries=2,
+                    limits=httpx.Limits(
+                        max_connections=_MAX_FETCH_WORKERS,
+                        max_keepalive_connections=_MAX_FETCH_WORKERS,
+                    ),
+                ),
+            )
+        return _client
+
 
 def _normalize_temp_unit(temp_unit: str) -> str | None:
     """
@@ -44,10 +87,14 @@ def _normalize_temp_unit(temp_unit: str) -> str | None:
     return None
 
 
-def _get_bundled_years(station_id: str) -> set[int]:
+@cache
+def _get_bundled_years(station_id: str) -> frozenset[int]:
     """
     Get years available in bundled sample data for a station.
 
+    The bundled data directory doesn't change while the package is installed, so results are
+    cached per station. Call `_get_bundled_years.cache_clear()` to force a rescan.
+
     Parameters
     ----------
     station_id
@@ -55,22 +102,23 @@ def _get_bundled_years(station_id: str) -> set[int]:
 
     Returns
     -------
-    set[int]
+    frozenset[int]
         Set of years available in bundled data, empty if none.
     """
     try:
         data_files = importlib.resources.files("weathervault.data")
+        prefix = f"{station_id}-"
         bundled_years = set()
         for item in data_files.iterdir():
             name = item.name
-            if name.startswith(f"{station_id}-") and name.endswith(".gz"):
+            if name.startswith(prefix) and name.endswith(".gz"):
                 # Extract year from filename like "725030-14732-2023.gz"
-                year_str = name.replace(f"{station_id}-", "").replace(".gz", "")
+                year_str = name[len(prefix) : -len(".gz")]
                 with contextlib.suppress(ValueError):
                     bundled_years.add(int(year_str))
-        return bundled_years
+        return frozenset(bundled_years)
     except (ModuleNotFoundError, FileNotFoundError, TypeError):
-        return set()
+        return frozenset()
 
 
 def get_weather_data(
@@ -112,7 +160,10 @@ def get_weather_data(
         data to memory without saving to disk (will check current working directory for existing
         cached files first), (2) `"."` saves to and loads from current working directory, and (3) a
         path string serving as a custom directory path for caching files. Cached files are named as
-        `"{station_id}-{year}.gz"`.
+        `"{station_id}-{year}.gz"`. Files for past years are reused indefinitely, while a cached file
+        for the current year is refreshed once it is more than six hours old. With `None`, an
+        outdated current-year file in the working directory is not rewritten, so that year is
+        downloaded again on every call.
     incl_stn_info
         Whether to include station metadata in the output. When True, adds columns for station name,
         country, state, ICAO code, latitude, longitude, and elevation. Default is `False`.
@@ -245,7 +296,8 @@ def get_weather_data(
     # Check if we have bundled data for this station (for offline docs)
     bundled_years = _get_bundled_years(station_id)
 
-    # Determine years to fetch
+    # Determine years to fetch; `available_years` stays `None` unless the inventory is consulted
+    available_years = None
     if years is None:
         # When years=None, we need to know all available years from inventory
         available_years = get_years_for_station(station_id)
@@ -311,11 +363,14 @@ def get_weather_data(
     # Jan 1 08:00 local time (UTC+9), or Jan 1 05:00 UTC might become Dec 31 21:00
     # local time (UTC-8). By fetching adjacent years, we ensure complete coverage.
     if convert_to_local and years_to_fetch:
-        buffer_years = set(years_to_fetch)
-        for year in requested_years:
-            buffer_years.add(year - 1)  # Previous year for positive UTC offsets
-            buffer_years.add(year + 1)  # Next year for negative UTC offsets
-        years_to_fetch = sorted(buffer_years)
+        # Previous year for positive UTC offsets, next year for negative UTC offsets
+        fetch_set = set(years_to_fetch)
+        buffer_years = {year - 1 for year in fetch_set} | {year + 1 for year in fetch_set}
+        # A buffer year the station has no file for (e.g. before its first year of records)
+        # would only cost a request that ends in a 404, so skip it when the inventory is known
+        if available_years:
+            buffer_years &= bundled_years.union(available_years)
+        years_to_fetch = sorted(fetch_set | buffer_years)
 
     # Set up cache directory if specified
     # Special case: "." means use current working directory
@@ -327,11 +382,20 @@ def get_weather_data(
     else:
         cache_path = None
 
-    # Download and parse data for each year
+    # Each station-year is a separate file, so download them concurrently; `map()` yields the
+    # results in `years_to_fetch` order and re-raises any download error here
+    workers = max(1, min(_MAX_FETCH_WORKERS, len(years_to_fetch)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        fetched = list(
+            executor.map(
+                lambda year: _fetch_year_data(station_id, year, cache_path), years_to_fetch
+            )
+        )
+
+    # Parse and process data for each year
     all_data: list[pl.DataFrame] = []
 
-    for year in years_to_fetch:
-        data = _fetch_year_data(station_id, year, cache_path)
+    for data in fetched:
         if data is not None:
             df = parse_isd_data(data)
             if df.height > 0:
@@ -349,16 +413,17 @@ def get_weather_data(
             incl_stn_info=incl_stn_info, time_as_columns=time_as_columns
         )
 
-    # Combine all years
-    result = pl.concat(all_data)
-
-    # Sort by time
-    result = result.sort("time")
-
-    # Filter to requested years only (trimming buffer years used for timezone handling)
-    # This ensures users get exactly the years they asked for, with complete data
-    # at year boundaries after timezone conversion
-    result = result.filter(pl.col("time").dt.year().is_in(requested_years))
+    # Combine all years, filter to requested years only (trimming buffer years used for timezone
+    # handling) and sort by time in one lazy query. This ensures users get exactly the years they
+    # asked for, with complete data at year boundaries after timezone conversion. The per-year
+    # frames aren't rechunked up front and buffer-year rows are dropped before the sort
+    result = (
+        pl.concat(all_data, rechunk=False)
+        .lazy()
+        .filter(pl.col("time").dt.year().is_in(requested_years))
+        .sort("time")
+        .collect()
+    )
 
     # Optionally resample to hourly
     if make_hourly:
@@ -387,7 +452,11 @@ def _fetch_year_data(
     2. The specified cache directory (if provided)
     3. The current working directory
 
-    If not found locally, downloads from NCEI and caches if `cache_path=` is set.
+    If not found locally, downloads from NCEI and caches if `cache_path=` is set. A local file
+    for the current year is only used while it is recent (see `_CURRENT_YEAR_CACHE_MAX_AGE`),
+    since NCEI keeps appending to it; a stale copy is still returned if the download fails. Only
+    `cache_path=` is ever written to, so an outdated copy found in the working directory alone is
+    downloaded again on every call.
 
     Parameters
     ----------
@@ -416,43 +485,60 @@ def _fetch_year_data(
         # No bundled data available, continue to other sources
         pass
 
-    # Check cache directory (if provided)
-    if cache_path:
-        cached_file = cache_path / filename
-        if cached_file.exists():
-            return cached_file.read_bytes()
-
-    # Always check current working directory for existing cached files
-    # This allows offline use if files were previously downloaded
-    cwd_cached_file = Path.cwd() / filename
-    if cwd_cached_file.exists():
-        return cwd_cached_file.read_bytes()
+    # Check the cache directory (if provided), then always the current working directory for
+    # existing cached files; this allows offline use if files were previously downloaded
+    local_files = [cache_path / filename] if cache_path else []
+    local_files.append(Path.cwd() / filename)
+
+    # Only the current year's file can go stale, so the date is looked up once and past years
+    # skip the modification-time check entirely
+    expires = year >= date.today().year
+    stale_file = None
+    for local_file in local_files:
+        with contextlib.suppress(FileNotFoundError):
+            if (
+                not expires
+                or time.time() - local_file.stat().st_mtime < _CURRENT_YEAR_CACHE_MAX_AGE
+            ):
+                return local_file.read_bytes()
+            stale_file = stale_file or local_file
 
     # Download from NCEI
     url = f"{BASE_URL}/{year}/{filename}"
 
     try:
-        with httpx.Client(timeout=120.0, follow_redirects=True) as client:
-            response = client.get(url)
-            response.raise_for_status()
-            data = response.content
-
-            # Cache if directory specified
-            if cache_path and data:
-                cached_file = cache_path / filename
-                cached_file.write_bytes(data)
-
-            return data
-
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            # Data not available for this year
-            return None
-        raise
-    except httpx.RequestError:
-        # Network error
+        response = _get_client().get(url)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        # Whether NCEI is unreachable or answers with an error, fall back to an outdated local
+        # copy of the current year, if any
+        if stale_file:
+            return stale_file.read_bytes()
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code != 404:
+            raise
+        # Network error, or data not available for this year
         return None
 
+    data = response.content
+
+    # Cache if directory specified; the file is written under a uniquely named temporary file
+    # and renamed into place, so concurrent readers (other threads or processes sharing the
+    # cache) never see a partially written file
+    if cache_path and data:
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path, prefix=f"{filename}.", suffix=".tmp", delete=False
+        ) as tmp_file:
+            try:
+                tmp_file.write(data)
+                tmp_file.close()
+                os.replace(tmp_file.name, cache_path / filename)
+            except BaseException:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(tmp_file.name)
+                raise
+
+    return data
+
 
 def _make_hourly(
     df: pl.DataFrame,